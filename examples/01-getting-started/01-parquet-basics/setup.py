@@ -7,8 +7,8 @@ import sys
 # Add parent directory to path to import shared generators
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
-from _shared.data_generators import generate_users
-from _shared.utils import check_prerequisites, print_separator
+from _shared.data_generators import users, generate_users
+from _shared.utils import check_prerequisites, outputs_up_to_date, print_separator
 
 
 def main():
@@ -20,14 +20,22 @@ def main():
     check_prerequisites()
     print_separator()
 
-    # Ensure data directory exists
-    os.makedirs("data", exist_ok=True)
-
-    # Generate users data
-    print("Generating sample data...")
-    generate_users(
-        size="small", output_format="parquet", output_path="data/users.parquet"
-    )
+    # Skip regeneration when the data is newer than this script and the
+    # generators producing it
+    outputs = ["data/users.parquet"]
+    if outputs_up_to_date(outputs, __file__, users.__file__):
+        print(
+            "Sample data is up to date (delete the data/ directory to regenerate it)"
+        )
+    else:
+        # Ensure data directory exists
+        os.makedirs("data", exist_ok=True)
+
+        # Generate users data
+        print("Generating sample data...")
+        generate_users(
+            size="small", output_format="parquet", output_path="data/users.parquet"
+        )
 
     print_separator()
     print("Setup complete!")
@@ -7,92 +7,272 @@ environment variable scenarios to demonstrate security best practices.
 """
 
 import os
+import re
 import sys
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Accepted values for the validated variables
+_ENV_DEV = frozenset({"development", "dev"})
+_ENV_PROD = frozenset({"production", "prod"})
+_DEV_SSL = frozenset({"prefer", "disable", "allow"})
+_PROD_SSL = frozenset({"require", "verify-ca", "verify-full"})
+
+# Required variables by environment type as (name, valid values or None)
+# pairs; None means any value is acceptable
+_REQUIRED_VARS = {
+    "dev": (
+        ("ENVIRONMENT", _ENV_DEV),
+        ("CATALOG_NAME", None),
+        ("MEMORY_LIMIT", None),
+        ("THREAD_COUNT", None),
+        ("TIMEZONE", None),
+        ("AWS_REGION", None),
+        ("DATA_BUCKET_PREFIX", None),
+        ("DB_HOST", None),
+        ("DB_PORT", None),
+        ("DB_NAME", None),
+        ("DB_USER", None),
+        ("DB_PASSWORD", None),
+        ("DB_SSL_MODE", _DEV_SSL),
+        ("REFERENCE_DB_PATH", None),
+    ),
+    "prod": (
+        ("ENVIRONMENT", _ENV_PROD),
+        ("CATALOG_NAME", None),
+        ("MEMORY_LIMIT", None),
+        ("THREAD_COUNT", None),
+        ("TIMEZONE", None),
+        ("AWS_REGION", None),
+        ("AWS_ACCESS_KEY_ID", None),
+        ("AWS_SECRET_ACCESS_KEY", None),
+        ("DATA_BUCKET_PREFIX", None),
+        ("DB_HOST", None),
+        ("DB_PORT", None),
+        ("DB_NAME", None),
+        ("DB_USER", None),
+        ("DB_PASSWORD", None),
+        ("DB_SSL_MODE", _PROD_SSL),
+        ("ICEBERG_URI", None),
+        ("ICEBERG_TOKEN", None),
+        ("WAREHOUSE_BUCKET", None),
+    ),
+}
+
+# Variables that may be missing without failing validation
+_OPTIONAL_VARS = {
+    "dev": ("AWS_SESSION_TOKEN", "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"),
+    "prod": (),
+}
+
+# Example values suggested for missing variables
+_GUIDANCE_VALUES = {
+    "AWS_ACCESS_KEY_ID": "your-access-key",
+    "AWS_SECRET_ACCESS_KEY": "your-secret-key",
+    "DB_PASSWORD": "your-database-password",
+}
+
+# Potential hardcoded secrets: AWS access key IDs and secret-like field names
+_SUSPICIOUS_RE = re.compile(r"AKIA[0-9A-Z]{16}|(?i:password|secret|token)")
+# Lines matching these are env references or sample values, not real secrets
+_SAFE_RE = re.compile(r"\$\{env:|example|placeholder|test")
+
+# KEY=value lines in .env files; blank lines and comments don't match
+_ENV_LINE_RE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$")
+
+# Snapshot of os.environ shared by the checks; see invalidate_env_snapshot()
+_ENV_SNAPSHOT = None
+
+
+def get_env_snapshot():
+    """Return a cached copy of the process environment."""
+    global _ENV_SNAPSHOT
+    if _ENV_SNAPSHOT is None:
+        _ENV_SNAPSHOT = dict(os.environ)
+    return _ENV_SNAPSHOT
+
+
+def invalidate_env_snapshot():
+    """Drop the cached environment so the next lookup sees os.environ changes."""
+    global _ENV_SNAPSHOT
+    _ENV_SNAPSHOT = None
+
+
+def _needs_runtime_resolution(error):
+    """Whether a load error comes from ${env:...} values in typed fields."""
+    message = str(error)
+    return "int_parsing" in message and "env:" in message
+
+
+def _stat_key(config_path):
+    """Cache key that changes whenever the file is modified."""
+    stat = os.stat(config_path)
+    return str(config_path), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=16)
+def _load_entry(path, mtime_ns, size):
+    from duckalog import load_config
+
+    content = Path(path).read_text()
+    try:
+        return load_config(path), None, content, None
+    except Exception as e:
+        if not _needs_runtime_resolution(e):
+            return None, None, content, e
+        # Environment variables are resolved at runtime; fall back to the raw YAML
+        return None, yaml.load(content, Loader=_YamlLoader), content, None
+    finally:
+        # load_config exports variables from .env files it finds next to the
+        # config, so later checks must not read a snapshot taken before it
+        invalidate_env_snapshot()
+
+
+def _load_cached(config_path):
+    """Load a config once per file version for all validation passes.
+
+    Returns ``(config, raw_data, content)``. ``config`` is None and
+    ``raw_data`` holds the parsed YAML when environment variables can only
+    be resolved at runtime. Other load errors are raised.
+    """
+    config, raw_data, content, error = _load_entry(*_stat_key(config_path))
+    if error is not None:
+        raise error
+    return config, raw_data, content
+
+
+@functools.lru_cache(maxsize=16)
+def _generate_sql_entry(path, mtime_ns, size):
+    from duckalog import generate_all_views_sql
+
+    config, _, _ = _load_cached(path)
+    return generate_all_views_sql(config) if config is not None else None
+
+
+def _generate_sql_cached(config_path):
+    """Generate the view SQL for a config, reusing the cached load.
+
+    Returns None when the config needs runtime environment resolution.
+    """
+    return _generate_sql_entry(*_stat_key(config_path))
+
+
+# Marks raw attachment entries that leave a checked key unset
+_UNSET = object()
+
+
+@dataclass(slots=True)
+class AttachmentSummary:
+    """Attachment flags gathered in a single pass for the config checks."""
+
+    has_prefer_ssl: bool = False
+    has_strict_ssl: bool = False
+    all_strict_ssl: bool = False
+    all_duckdb_readonly: bool = False
+    postgres_count: int = 0
+    duckdb_count: int = 0
+
+
+def _summarize_attachments(config, raw_data):
+    """Walk the loaded or raw attachments once, collecting the SSL and read-only flags.
+
+    Returns None when the configuration has no attachments section. Raw YAML
+    entries without an ``sslmode``/``read_only`` key are counted but do not
+    take part in the SSL and read-only checks.
+    """
+    if config is not None:
+        attachments = getattr(config, "attachments", None)
+        if not attachments:
+            return None
+        ssl_modes = (a.sslmode for a in attachments.postgres or ())
+        readonly_flags = (a.read_only for a in attachments.duckdb or ())
+    else:
+        attachments = raw_data.get("attachments") if isinstance(raw_data, dict) else None
+        if not attachments:
+            return None
+        ssl_modes = (p.get("sslmode", _UNSET) for p in attachments.get("postgres") or ())
+        readonly_flags = (d.get("read_only", _UNSET) for d in attachments.get("duckdb") or ())
+
+    summary = AttachmentSummary()
+    checked = 0
+    all_strict = True
+    for sslmode in ssl_modes:
+        summary.postgres_count += 1
+        if sslmode is _UNSET:
+            continue
+        checked += 1
+        if sslmode == "prefer":
+            summary.has_prefer_ssl = True
+        if sslmode in _PROD_SSL:
+            summary.has_strict_ssl = True
+        else:
+            all_strict = False
+    summary.all_strict_ssl = all_strict and checked > 0
+
+    checked = 0
+    all_readonly = True
+    for read_only in readonly_flags:
+        summary.duckdb_count += 1
+        if read_only is _UNSET:
+            continue
+        checked += 1
+        if not read_only:
+            all_readonly = False
+    summary.all_duckdb_readonly = all_readonly and checked > 0
+
+    return summary
+
+
+@functools.lru_cache(maxsize=16)
+def _attachment_summary_entry(path, mtime_ns, size):
+    config, raw_data, _ = _load_cached(path)
+    return _summarize_attachments(config, raw_data)
+
+
+def _attachment_summary_cached(config_path):
+    """Summarize a config's attachments once per file version."""
+    return _attachment_summary_entry(*_stat_key(config_path))
+
+
 def validate_environment_variables(env_type="dev"):
     """Validate environment variables for a specific environment type."""
     print(f"\n🔍 Validating {env_type.upper()} environment variables...")
 
-    # Define required variables by environment type
-    if env_type == "dev":
-        required_vars = {
-            "ENVIRONMENT": ["development", "dev"],
-            "CATALOG_NAME": None,  # Any value is acceptable
-            "MEMORY_LIMIT": None,
-            "THREAD_COUNT": None,
-            "TIMEZONE": None,
-            "AWS_REGION": None,
-            "DATA_BUCKET_PREFIX": None,
-            "DB_HOST": None,
-            "DB_PORT": None,
-            "DB_NAME": None,
-            "DB_USER": None,
-            "DB_PASSWORD": None,
-            "DB_SSL_MODE": ["prefer", "disable", "allow"],
-            "REFERENCE_DB_PATH": None
-        }
-
-        # Optional variables for dev (can be missing)
-        optional_vars = ["AWS_SESSION_TOKEN", "AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"]
-    elif env_type == "prod":
-        required_vars = {
-            "ENVIRONMENT": ["production", "prod"],
-            "CATALOG_NAME": None,
-            "MEMORY_LIMIT": None,
-            "THREAD_COUNT": None,
-            "TIMEZONE": None,
-            "AWS_REGION": None,
-            "AWS_ACCESS_KEY_ID": None,
-            "AWS_SECRET_ACCESS_KEY": None,
-            "DATA_BUCKET_PREFIX": None,
-            "DB_HOST": None,
-            "DB_PORT": None,
-            "DB_NAME": None,
-            "DB_USER": None,
-            "DB_PASSWORD": None,
-            "DB_SSL_MODE": ["require", "verify-ca", "verify-full"],
-            "ICEBERG_URI": None,
-            "ICEBERG_TOKEN": None,
-            "WAREHOUSE_BUCKET": None
-        }
-    else:
+    if env_type not in _REQUIRED_VARS:
         raise ValueError(f"Unknown environment type: {env_type}")
 
+    env = get_env_snapshot()
     missing_vars = []
     invalid_vars = []
 
     # Check required variables
-    for var_name, valid_values in required_vars.items():
-        value = os.environ.get(var_name)
+    for var_name, valid_values in _REQUIRED_VARS[env_type]:
+        value = env.get(var_name)
 
         if value is None:
             missing_vars.append(var_name)
         elif valid_values and value not in valid_values:
-            invalid_vars.append(f"{var_name}='{value}' (expected: {valid_values})")
+            invalid_vars.append(f"{var_name}='{value}' (expected: {sorted(valid_values)})")
 
     # Check optional variables (note their presence but don't fail)
-    optional_missing = []
-    if 'optional_vars' in locals():
-        for var_name in optional_vars:
-            value = os.environ.get(var_name)
-            if value is None:
-                optional_missing.append(var_name)
+    optional_missing = [var_name for var_name in _OPTIONAL_VARS[env_type] if var_name not in env]
 
     if missing_vars:
         print(f"❌ Missing environment variables: {', '.join(missing_vars)}")
 
         # Provide guidance for missing variables
-        guidance = []
-        for var in missing_vars:
-            if var == "AWS_ACCESS_KEY_ID":
-                guidance.append(f"export AWS_ACCESS_KEY_ID='your-access-key'")
-            elif var == "AWS_SECRET_ACCESS_KEY":
-                guidance.append(f"export AWS_SECRET_ACCESS_KEY='your-secret-key'")
-            elif var == "DB_PASSWORD":
-                guidance.append(f"export DB_PASSWORD='your-database-password'")
-            else:
-                guidance.append(f"export {var}='your-value'")
+        guidance = [f"export {var}='{_GUIDANCE_VALUES.get(var, 'your-value')}'" for var in missing_vars]
 
         if guidance:
             print("💡 Set them with:")
@@ -119,29 +299,21 @@ def validate_config_file(config_path, env_type):
     print(f"\n📄 Validating configuration file: {config_path}")
 
     try:
-        from duckalog import load_config, validate_config
-
         # Validate configuration syntax and environment variable resolution
-        config = None
-        try:
-            config = load_config(config_path)
+        config, _, _ = _load_cached(config_path)
+        if config is not None:
             print(f"✅ Configuration file syntax and environment variables are valid")
-        except Exception as e:
-            # Handle the case where environment variables aren't resolved yet
-            if "int_parsing" in str(e) and "env:" in str(e):
-                print(f"⚠️  Configuration syntax valid, but environment variables need to be set at runtime")
-                print(f"    This is expected for fields with ${{env:...}} syntax in integer fields")
-                # Continue with basic validation by reading the file
-                import yaml
-                with open(config_path, 'r') as f:
-                    config_data = yaml.safe_load(f)
-                print(f"✅ Configuration file structure is valid")
-                config = None  # Set to None to skip config-dependent checks
-            else:
-                raise e
+        else:
+            # Handle the case where environment variables aren't resolved yet;
+            # the raw YAML parsed, so config-dependent checks are skipped
+            print(f"⚠️  Configuration syntax valid, but environment variables need to be set at runtime")
+            print(f"    This is expected for fields with ${{env:...}} syntax in integer fields")
+            print(f"✅ Configuration file structure is valid")
 
         # Check environment-specific expectations if config is available
         if config is not None:
+            attachments = _attachment_summary_cached(config_path)
+
             if env_type == "dev":
                 # Development config should have defaults
                 if hasattr(config.duckdb, 'pragmas') and config.duckdb.pragmas:
@@ -150,10 +322,8 @@ def validate_config_file(config_path, env_type):
                         print(f"✅ Development memory pragma found: {memory_pragma[0]}")
 
                 # Check for development-specific settings
-                if hasattr(config, 'attachments') and config.attachments:
-                    postgres_attachments = [a for a in config.attachments.postgres if a.sslmode == 'prefer']
-                    if postgres_attachments:
-                        print("✅ Development database uses prefer SSL mode")
+                if attachments is not None and attachments.has_prefer_ssl:
+                    print("✅ Development database uses prefer SSL mode")
 
             elif env_type == "prod":
                 # Production config should not rely on defaults
@@ -166,15 +336,14 @@ def validate_config_file(config_path, env_type):
                             print(f"⚠️  Production memory might be low: {memory_pragma[0]}")
 
                 # Check for production-specific settings
-                if hasattr(config, 'attachments') and config.attachments:
-                    postgres_attachments = [a for a in config.attachments.postgres if a.sslmode in ['require', 'verify-ca', 'verify-full']]
-                    if postgres_attachments:
+                if attachments is not None:
+                    if attachments.has_strict_ssl:
                         print("✅ Production database enforces SSL")
                     else:
                         print("⚠️  Production database should enforce SSL")
 
                 # Check for Iceberg catalog if environment variables suggest it
-                if os.environ.get("ICEBERG_URI") and hasattr(config, 'iceberg_catalogs'):
+                if get_env_snapshot().get("ICEBERG_URI") and hasattr(config, 'iceberg_catalogs'):
                     print("✅ Production Iceberg catalog configuration found")
         else:
             # Config wasn't loaded due to environment variable resolution issues
@@ -195,10 +364,14 @@ def test_environment_resolution(config_path):
     print(f"\n🧪 Testing environment variable resolution...")
 
     try:
-        from duckalog import generate_sql
-
         # Generate SQL to test environment variable resolution
-        sql_content = generate_sql(config_path)
+        sql_content = _generate_sql_cached(config_path)
+
+        if sql_content is None:
+            print("⚠️  Environment resolution test shows runtime resolution needed")
+            print("    This is expected for integer fields with ${env:...} syntax")
+            print("✅ Environment variable syntax appears correct")
+            return True
 
         # Check for unresolved environment variables
         unresolved = [line for line in sql_content.split('\n') if '${env:' in line]
@@ -215,14 +388,8 @@ def test_environment_resolution(config_path):
             return True
 
     except Exception as e:
-        if "int_parsing" in str(e) and "env:" in str(e):
-            print("⚠️  Environment resolution test shows runtime resolution needed")
-            print("    This is expected for integer fields with ${env:...} syntax")
-            print("✅ Environment variable syntax appears correct")
-            return True
-        else:
-            print(f"❌ Environment resolution test failed: {e}")
-            return False
+        print(f"❌ Environment resolution test failed: {e}")
+        return False
 
 
 def check_security_best_practices(config_path):
@@ -230,46 +397,35 @@ def check_security_best_practices(config_path):
     print(f"\n🛡️  Checking security best practices...")
 
     try:
-        from duckalog import load_config
-
-        try:
-            config = load_config(config_path)
-        except Exception as e:
-            if "int_parsing" in str(e) and "env:" in str(e):
-                # For security checks, we can read the raw YAML file
-                import yaml
-                with open(config_path, 'r') as f:
-                    config_data = yaml.safe_load(f)
-                config = None
-                print("ℹ️  Security checks performed on raw configuration (environment variables not resolved)")
-            else:
-                raise e
+        # For security checks, we can fall back to the raw YAML file
+        config, config_data, content = _load_cached(config_path)
+        if config is None:
+            print("ℹ️  Security checks performed on raw configuration (environment variables not resolved)")
 
         security_score = 0
         total_checks = 0
 
         # Check 1: No hardcoded secrets in configuration
-        with open(config_path, 'r') as f:
-            content = f.read()
-
-        # Look for potential hardcoded secrets
-        suspicious_patterns = [
-            'AKIA',  # AWS access key pattern
-            'password',  # Password field
-            'secret',  # Secret field
-            'token'  # Token field
-        ]
-
-        safe_patterns = ['${env:', 'example', 'placeholder', 'test']
 
+        # Look for potential hardcoded secrets in a single pass over the file,
+        # reporting each offending line once
         hardcoded_secrets = []
-        for pattern in suspicious_patterns:
-            if pattern in content.lower():
-                # Check if it's actually a hardcoded secret (not using env vars)
-                lines = content.split('\n')
-                for i, line in enumerate(lines, 1):
-                    if pattern in line.lower() and not any(safe in line for safe in safe_patterns):
-                        hardcoded_secrets.append(f"Line {i}: {line.strip()[:80]}...")
+        line_no = 1
+        scanned_to = 0
+        last_line_start = -1
+        for match in _SUSPICIOUS_RE.finditer(content):
+            line_start = content.rfind("\n", 0, match.start()) + 1
+            if line_start == last_line_start:
+                continue
+            last_line_start = line_start
+            line_no += content.count("\n", scanned_to, line_start)
+            scanned_to = line_start
+
+            line_end = content.find("\n", match.end())
+            line = content[line_start:line_end if line_end != -1 else len(content)]
+            # Check if it's actually a hardcoded secret (not using env vars)
+            if not _SAFE_RE.search(line):
+                hardcoded_secrets.append(f"Line {line_no}: {line.strip()[:80]}...")
 
         total_checks += 1
         if not hardcoded_secrets:
@@ -280,45 +436,26 @@ def check_security_best_practices(config_path):
             for secret in hardcoded_secrets[:3]:
                 print(f"   {secret}")
 
+        attachments = _attachment_summary_cached(config_path)
+        source = " (from raw config)" if config is None else ""
+
         # Check 2: SSL configuration
         total_checks += 1
-        if config is not None and hasattr(config, 'attachments') and config.attachments:
-            ssl_configs = [a for a in (config.attachments.postgres or []) if hasattr(a, 'sslmode')]
-            if ssl_configs and all(a.sslmode in ['require', 'verify-ca', 'verify-full'] for a in ssl_configs):
-                print("✅ Database SSL is properly configured")
+        if attachments is not None and attachments.postgres_count:
+            if attachments.all_strict_ssl:
+                print("✅ Database SSL is properly configured" + source)
                 security_score += 1
             else:
                 print("⚠️  Database SSL configuration could be improved")
-        elif config is None:
-            # Check in raw YAML data
-            if 'attachments' in config_data and 'postgres' in config_data['attachments']:
-                postgres_configs = config_data['attachments']['postgres']
-                ssl_modes = [p.get('sslmode') for p in postgres_configs if 'sslmode' in p]
-                if ssl_modes and all(mode in ['require', 'verify-ca', 'verify-full'] for mode in ssl_modes):
-                    print("✅ Database SSL is properly configured (from raw config)")
-                    security_score += 1
-                else:
-                    print("⚠️  Database SSL configuration could be improved")
 
         # Check 3: Read-only attachments where appropriate
         total_checks += 1
-        if config is not None and hasattr(config, 'attachments') and config.attachments:
-            readonly_configs = [a for a in (config.attachments.duckdb or []) if hasattr(a, 'read_only')]
-            if readonly_configs and all(a.read_only for a in readonly_configs):
-                print("✅ DuckDB attachments are marked as read-only")
+        if attachments is not None and attachments.duckdb_count:
+            if attachments.all_duckdb_readonly:
+                print("✅ DuckDB attachments are marked as read-only" + source)
                 security_score += 1
             else:
                 print("ℹ️  Consider marking DuckDB attachments as read-only when appropriate")
-        elif config is None:
-            # Check in raw YAML data
-            if 'attachments' in config_data and 'duckdb' in config_data['attachments']:
-                duckdb_configs = config_data['attachments']['duckdb']
-                readonly_flags = [d.get('read_only') for d in duckdb_configs if 'read_only' in d]
-                if readonly_flags and all(readonly_flags):
-                    print("✅ DuckDB attachments are marked as read-only (from raw config)")
-                    security_score += 1
-                else:
-                    print("ℹ️  Consider marking DuckDB attachments as read-only when appropriate")
 
         # Security score summary
         print(f"\n📊 Security Score: {security_score}/{total_checks}")
@@ -330,8 +467,13 @@ def check_security_best_practices(config_path):
         return False
 
 
-def validate_complete_setup(env_type):
-    """Perform complete validation for a specific environment."""
+def validate_complete_setup(env_type, fail_fast=False):
+    """Perform complete validation for a specific environment.
+
+    With ``fail_fast`` the remaining checks are skipped after the first
+    failure, e.g. so missing environment variables don't trigger config
+    loading and SQL generation that are bound to fail.
+    """
     print(f"\n🚀 Starting complete {env_type.upper()} environment validation...")
     print("=" * 60)
 
@@ -341,25 +483,26 @@ def validate_complete_setup(env_type):
         print(f"❌ Configuration file not found: {config_file}")
         return False
 
-    # Run all validation checks
+    # Run all validation checks, cheapest first
+    checks = (
+        # Check 1: Environment variables
+        lambda: validate_environment_variables(env_type),
+        # Check 2: Configuration file
+        lambda: validate_config_file(config_file, env_type),
+        # Check 3: Environment resolution
+        lambda: test_environment_resolution(config_file),
+        # Check 4: Security best practices
+        lambda: check_security_best_practices(config_file),
+    )
     checks_passed = 0
-    total_checks = 4
+    total_checks = len(checks)
 
-    # Check 1: Environment variables
-    if validate_environment_variables(env_type):
-        checks_passed += 1
-
-    # Check 2: Configuration file
-    if validate_config_file(config_file, env_type):
-        checks_passed += 1
-
-    # Check 3: Environment resolution
-    if test_environment_resolution(config_file):
-        checks_passed += 1
-
-    # Check 4: Security best practices
-    if check_security_best_practices(config_file):
-        checks_passed += 1
+    for check in checks:
+        if check():
+            checks_passed += 1
+        elif fail_fast:
+            print("\n⏭️  Skipping remaining checks (--fail-fast)")
+            break
 
     # Summary
     print(f"\n📋 Validation Summary: {checks_passed}/{total_checks} checks passed")
@@ -372,6 +515,93 @@ def validate_complete_setup(env_type):
         return False
 
 
+class _ThreadCapture:
+    """Per-thread record of stdout/stderr writes, replayed later in order."""
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def start(self):
+        self._local.chunks = []
+
+    def stop(self):
+        chunks = self._local.chunks
+        self._local.chunks = None
+        return chunks
+
+    def wrap(self, stream):
+        return _CapturedStream(self, stream)
+
+    @staticmethod
+    def replay(chunks):
+        """Write captured chunks to their original streams in order."""
+        previous = None
+        for stream, text in chunks:
+            if previous is not None and stream is not previous:
+                previous.flush()
+            stream.write(text)
+            previous = stream
+        if previous is not None:
+            previous.flush()
+
+
+class _CapturedStream:
+    """Stream proxy that records writes from capturing threads."""
+
+    def __init__(self, capture, stream):
+        self._capture = capture
+        self._stream = stream
+
+    def write(self, text):
+        chunks = getattr(self._capture._local, "chunks", None)
+        if chunks is None:
+            return self._stream.write(text)
+        chunks.append((self._stream, text))
+        return len(text)
+
+    def flush(self):
+        if getattr(self._capture._local, "chunks", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def validate_environments_concurrently(env_types):
+    """Validate independent environments in parallel.
+
+    Each environment's report, including duckalog's log messages on stderr,
+    is captured separately and replayed in ``env_types`` order, so the
+    output reads the same as a serial run.
+    """
+    capture = _ThreadCapture()
+
+    def run(env_type):
+        capture.start()
+        try:
+            passed = validate_complete_setup(env_type)
+        finally:
+            chunks = capture.stop()
+        return passed, chunks
+
+    stdout, stderr = sys.stdout, sys.stderr
+    # Install the proxies before duckalog is first imported by the workers:
+    # loguru binds its default handler to the sys.stderr object it sees then
+    sys.stdout, sys.stderr = capture.wrap(stdout), capture.wrap(stderr)
+    try:
+        with ThreadPoolExecutor(max_workers=len(env_types)) as executor:
+            futures = [executor.submit(run, env_type) for env_type in env_types]
+            results = []
+            for future in futures:
+                passed, chunks = future.result()
+                _ThreadCapture.replay(chunks)
+                results.append(passed)
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+    return results
+
+
 def main():
     """Main validation function."""
     import argparse
@@ -384,6 +614,11 @@ def main():
         nargs="?",
         help="Environment to validate (dev, prod, or both)"
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failed check instead of running all of them"
+    )
 
     args = parser.parse_args()
 
@@ -396,23 +631,29 @@ def main():
         print(f"📁 Loading environment variables from: {env_file}")
 
         # Load environment variables from .env file
+        updates = {}
         with open(env_file, 'r') as f:
             for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
+                match = _ENV_LINE_RE.match(line)
+                if match:
+                    updates[match.group(1)] = match.group(2)
+        os.environ.update(updates)
+        invalidate_env_snapshot()
         print("✅ Environment variables loaded")
     else:
         print("⚠️  No .env file found. Using existing environment variables.")
 
     success = True
 
-    if args.environment in ["dev", "both"]:
-        success &= validate_complete_setup("dev")
+    if args.environment == "both" and not args.fail_fast:
+        # dev and prod share nothing but the environment, so validate both at once
+        success = all(validate_environments_concurrently(("dev", "prod")))
+
+    elif args.environment in ["dev", "both"]:
+        success &= validate_complete_setup("dev", fail_fast=args.fail_fast)
 
-    if args.environment in ["prod", "both"]:
-        success &= validate_complete_setup("prod")
+    if args.environment == "prod" or (args.environment == "both" and args.fail_fast and success):
+        success &= validate_complete_setup("prod", fail_fast=args.fail_fast)
 
     if success:
         print("\n🎉 All validations completed successfully!")
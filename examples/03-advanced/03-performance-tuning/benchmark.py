@@ -10,26 +10,102 @@ import os
 import sys
 import time
 import json
+import hashlib
+import secrets
 import statistics
+import tempfile
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
 from pathlib import Path
 from datetime import datetime
 import argparse
 import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DEFAULT_SERVER_ADDRESS = "localhost:6543"
+# Shared secret for --serve/--client; the server generates one when unset
+AUTHKEY_ENV = "DUCKALOG_BENCHMARK_AUTHKEY"
+# Upper bound on the warm-up and measured runs a client may request per query
+MAX_SERVER_RUNS = 100
+
+# Typed columns written by generate-datasets.py next to the properties JSON
+TYPED_EVENT_COLUMNS = ("duration_seconds", "page_url", "page_title", "revenue")
+
+# Derives the typed columns from the JSON for datasets that predate them
+LEGACY_EVENTS_SOURCE = """(
+    SELECT *,
+           CAST(properties->>'duration' AS INTEGER) AS duration_seconds,
+           properties->>'page_url' AS page_url,
+           properties->>'page_title' AS page_title,
+           CAST(properties->>'revenue' AS DOUBLE) AS revenue
+    FROM {scan}
+)"""
+
+
+def read_json(path):
+    """Load a JSON file, using orjson's faster parser when it is installed."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def write_json(data, path):
+    """Write indented JSON, using orjson's faster encoder when it is installed."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
 
 
 class PerformanceBenchmark:
     """Comprehensive performance benchmarking for DuckDB."""
 
-    def __init__(self, config_path, dataset_size="medium"):
+    def __init__(
+        self,
+        config_path,
+        dataset_size="medium",
+        warmup=1,
+        repetitions=5,
+        cold=False,
+        quiet=False,
+    ):
         self.config_path = config_path
         self.dataset_size = dataset_size
+        self.warmup = warmup
+        self.repetitions = max(1, repetitions)
+        self.cold = cold
+        self.quiet = quiet
+        self._view_names = set()
         self.results = {
             "config_name": Path(config_path).stem,
             "dataset_size": dataset_size,
             "timestamp": datetime.now().isoformat(),
+            "warmup_runs": warmup,
+            "repetitions": self.repetitions,
+            "cold": cold,
+            "fetch_mode": "arrow",
+            "fingerprint": None,
             "benchmarks": [],
         }
 
+    def log(self, message=""):
+        """Print progress output unless running with ``--quiet``."""
+        if not self.quiet:
+            print(message)
+
     def load_config(self):
         """Load and parse the Duckalog configuration."""
         try:
@@ -46,59 +122,193 @@ class PerformanceBenchmark:
         # Use in-memory database with configuration applied
         con = duckdb.connect(":memory:")
 
-        # Apply pragmas from configuration
-        if hasattr(config.duckdb, "pragmas") and config.duckdb.pragmas:
-            for pragma in config.duckdb.pragmas:
-                try:
-                    con.execute(pragma)
-                except Exception as e:
-                    print(f"⚠️  Warning: Failed to apply pragma '{pragma}': {e}")
+        # Apply pragmas from configuration in a single multi-statement batch
+        pragmas = self.config_pragmas(config)
+        if pragmas:
+            try:
+                con.execute(";\n".join(pragmas))
+            except duckdb.Error:
+                # Re-apply one by one to report exactly which pragma failed
+                for index, pragma in enumerate(pragmas):
+                    try:
+                        con.execute(pragma)
+                    except duckdb.Error as e:
+                        print(
+                            f"⚠️  Warning: Failed to apply pragma #{index} '{pragma}': {e}"
+                        )
+
+        if self.cold:
+            self.disable_caches(con)
+
+        self.results["effective_settings"] = self.get_effective_settings(con)
+        settings = ", ".join(
+            f"{name}={value}" for name, value in self.results["effective_settings"].items()
+        )
+        self.log(f"⚙️  Effective settings: {settings}")
 
         return con
 
+    @staticmethod
+    def config_pragmas(config):
+        """Return the configured pragmas without trailing semicolons."""
+        return [p.strip().rstrip(";") for p in config.duckdb.pragmas or []]
+
+    def get_effective_settings(self, connection):
+        """Read back the settings DuckDB is actually running with."""
+        names = ("threads", "memory_limit", "enable_object_cache")
+        rows = connection.execute(
+            "SELECT name, value FROM duckdb_settings() WHERE list_contains(?, name)",
+            [list(names)],
+        ).fetchall()
+        return dict(rows)
+
+    def disable_caches(self, connection):
+        """Turn off DuckDB's file and metadata caches so every run reads cold."""
+        for setting in ("enable_external_file_cache", "enable_object_cache"):
+            try:
+                connection.execute(f"SET {setting} = false")
+            except duckdb.Error:
+                # Setting not available in this DuckDB version
+                pass
+
+    @staticmethod
+    def percentile(values, pct):
+        """Return the given percentile of a list of samples."""
+        if len(values) < 2:
+            return values[0]
+        return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+    @staticmethod
+    def cycles_per_row(cpu_time, rows):
+        """Estimate CPU cycles spent per row from CPU time and clock speed."""
+        if psutil is None or not rows:
+            return None
+        freq = psutil.cpu_freq()
+        if not freq or not freq.current:
+            return None
+        return cpu_time * freq.current * 1e6 / rows
+
     def get_memory_usage(self, connection):
-        """Get current memory usage from DuckDB."""
+        """Get the bytes currently held by DuckDB's buffer manager."""
         try:
-            result = connection.execute("PRAGMA memory_limit").fetchone()
-            if result:
-                return result[0]
-        except:
+            result = connection.execute(
+                "SELECT SUM(memory_usage_bytes) FROM duckdb_memory()"
+            ).fetchone()
+            if result and result[0] is not None:
+                return int(result[0])
+        except duckdb.Error:
             pass
         return "unknown"
 
-    def run_benchmark_query(self, connection, query_name, query_sql):
-        """Run a single benchmark query and measure performance."""
-        print(f"  📊 Running {query_name}...")
+    def profile_query(self, connection, query_sql):
+        """Run a query once under DuckDB's JSON profiler and summarize it."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            profile_path = Path(tmp_dir) / "profile.json"
+            connection.execute("PRAGMA enable_profiling='json'")
+            connection.execute("PRAGMA profiling_mode='detailed'")
+            connection.execute(f"PRAGMA profiling_output='{profile_path.as_posix()}'")
+            try:
+                self.fetch(connection, query_sql)
+            finally:
+                connection.execute("PRAGMA disable_profiling")
+            # Queries answered from Parquet metadata alone (e.g. a bare
+            # COUNT(*)) have no physical plan, so no profile is written
+            if not profile_path.exists():
+                return {}
+            profile = read_json(profile_path)
+
+        # Sum operator time per operator name across the whole plan
+        operator_timings = {}
+        pending = list(profile.get("children", []))
+        while pending:
+            node = pending.pop()
+            name = node.get("operator_name") or node.get("name", "UNKNOWN")
+            timing = node.get("operator_timing", node.get("timing", 0.0))
+            operator_timings[name] = operator_timings.get(name, 0.0) + timing
+            pending.extend(node.get("children", []))
+
+        return {
+            "operator_timings": operator_timings,
+            "rows_examined": profile.get("cumulative_rows_scanned"),
+            "spill_bytes": profile.get("system_peak_temp_dir_size", 0),
+            "peak_buffer_memory": profile.get("system_peak_buffer_memory"),
+        }
+
+    @staticmethod
+    def fetch(connection, query_sql):
+        """Execute a query and materialize its result as an Arrow table.
+
+        Fetching into Arrow avoids building one Python tuple per row, which
+        would otherwise be counted in the measured query time.
+        """
+        return pa.table(connection.execute(query_sql).arrow())
 
-        # Clear caches between runs
-        connection.execute("CLEAR CACHE")
+    def run_benchmark_query(
+        self, connection, query_name, query_sql, warmup=None, repetitions=None
+    ):
+        """Run a single benchmark query and measure performance.
+
+        ``warmup`` and ``repetitions`` default to the values the benchmark
+        was created with.
+        """
+        warmup = self.warmup if warmup is None else warmup
+        repetitions = self.repetitions if repetitions is None else repetitions
+        self.log(f"  📊 Running {query_name}...")
 
-        # Measure performance
-        start_time = time.time()
         start_memory = self.get_memory_usage(connection)
 
         try:
-            result = connection.execute(query_sql).fetchall()
-            end_time = time.time()
+            # Warm-up runs populate DuckDB's caches and are not measured
+            if not self.cold:
+                for _ in range(warmup):
+                    self.fetch(connection, query_sql)
+
+            # Measure steady-state performance over several runs
+            durations = []
+            cpu_times = []
+            for _ in range(repetitions):
+                # process_time covers user + system time of all DuckDB threads
+                cpu_start_ns = time.process_time_ns()
+                start_ns = time.perf_counter_ns()
+                result = self.fetch(connection, query_sql)
+                end_ns = time.perf_counter_ns()
+                cpu_end_ns = time.process_time_ns()
+                durations.append((end_ns - start_ns) / 1e9)
+                cpu_times.append((cpu_end_ns - cpu_start_ns) / 1e9)
             end_memory = self.get_memory_usage(connection)
+            profile = self.profile_query(connection, query_sql)
 
             # Calculate metrics
-            duration = end_time - start_time
-            row_count = len(result)
+            duration = statistics.median(durations)
+            row_count = result.num_rows
+            result_bytes = result.nbytes
+            cpu_time = statistics.median(cpu_times)
 
             benchmark_result = {
                 "query_name": query_name,
                 "duration_seconds": duration,
+                "min_duration_seconds": min(durations),
+                "p95_duration_seconds": self.percentile(durations, 95),
+                "durations": durations,
                 "rows_returned": row_count,
                 "rows_per_second": row_count / duration if duration > 0 else 0,
-                "memory_before": str(start_memory),
-                "memory_after": str(end_memory),
+                "result_bytes": result_bytes,
+                "bytes_per_second": result_bytes / duration if duration > 0 else 0,
+                "cpu_time_seconds": cpu_time,
+                "memory_before": start_memory,
+                "memory_after": end_memory,
+                **profile,
                 "success": True,
                 "error": None,
             }
+            benchmark_result["cycles_per_row"] = self.cycles_per_row(
+                cpu_time, profile.get("rows_examined") or row_count
+            )
 
-            print(
-                f"    ✅ {duration:.3f}s, {row_count:,} rows ({row_count / duration:,.0f} rows/sec)"
+            self.log(
+                f"    ✅ {duration:.3f}s median ({min(durations):.3f}s min), "
+                f"{row_count:,} rows ({row_count / duration:,.0f} rows/sec), "
+                f"{cpu_time:.3f}s CPU"
             )
             return benchmark_result
 
@@ -110,29 +320,108 @@ class PerformanceBenchmark:
                 "duration_seconds": 0,
                 "rows_returned": 0,
                 "rows_per_second": 0,
-                "memory_before": str(start_memory),
-                "memory_after": str(end_memory),
+                "memory_before": start_memory,
+                "memory_after": end_memory,
                 "success": False,
                 "error": str(e),
             }
 
-    def run_full_benchmark(self, connection):
+    @staticmethod
+    def dataset_source(dataset_path):
+        """Return the ``read_parquet`` relation benchmark queries scan.
+
+        Datasets written before the typed property columns existed are
+        wrapped in a subquery that extracts them from the properties JSON,
+        which is slower, so a regeneration hint is printed.
+        """
+        scan = f"read_parquet('{Path(dataset_path).as_posix()}', hive_partitioning = false)"
+        columns = set(pq.read_schema(dataset_path).names)
+        if columns.issuperset(TYPED_EVENT_COLUMNS):
+            return scan
+
+        print(
+            f"⚠️  {dataset_path} has no typed property columns; extracting them "
+            "from JSON. Regenerate with 'python generate-datasets.py --force' "
+            "for representative timings."
+        )
+        return LEGACY_EVENTS_SOURCE.format(scan=scan)
+
+    def create_events_view(self, connection, view_name, source):
+        """Expose a dataset by name so catalog views can reference it."""
+        try:
+            connection.execute(
+                f"""
+                CREATE OR REPLACE VIEW {view_name} AS
+                SELECT event_id, timestamp, event_type, user_id, session_id, properties,
+                       duration_seconds, page_url, page_title, revenue
+                FROM {source}
+                """
+            )
+            self.log(f"✅ Created view {view_name}")
+            return True
+        except Exception as e:
+            print(f"❌ Failed to create view: {e}")
+            return False
+
+    def run_full_benchmark(self, connection, source):
         """Run the complete benchmark suite."""
-        print("🏃‍♂️ Running performance benchmark suite...")
+        self.log("🏃‍♂️ Running performance benchmark suite...")
+
+        benchmark_queries = self.get_benchmark_queries(source)
+
+        # Adapt queries based on available views
+        try:
+            existing_views = connection.execute("""
+                SELECT view_name FROM duckdb_views()
+                WHERE schema_name = 'main' AND NOT internal
+            """).fetchall()
+            view_names = {row[0] for row in existing_views}
+            self._view_names = view_names
 
+            # Use available views if they exist
+            if "test_aggregation" in view_names:
+                benchmark_queries.append(
+                    ("view_aggregation", "SELECT * FROM test_aggregation LIMIT 1000")
+                )
+            if "test_join" in view_names:
+                benchmark_queries.append(
+                    ("view_join", "SELECT * FROM test_join LIMIT 1000")
+                )
+            if "funnel_analysis" in view_names:
+                benchmark_queries.append(
+                    ("analytics_funnel", "SELECT * FROM funnel_analysis")
+                )
+
+        except Exception as e:
+            print(f"  ⚠️  Could not check available views: {e}")
+
+        # Run all benchmarks
+        for query_name, query_sql in benchmark_queries:
+            result = self.run_benchmark_query(connection, query_name, query_sql)
+            self.results["benchmarks"].append(result)
+
+        self.log("✅ Benchmark suite completed")
+
+    def get_benchmark_queries(self, source):
+        """Return the core ``(name, sql)`` benchmark queries.
+
+        ``source`` is the relation every query reads from. Passing the
+        ``read_parquet(...)`` call itself (rather than a view name) lets
+        DuckDB push projections and filters straight into the Parquet scan.
+        """
         benchmark_queries = [
             (
                 "simple_select",
                 """
                 SELECT COUNT(*) as total_events
-                FROM events_medium
+                FROM {events}
             """,
             ),
             (
                 "simple_aggregation",
                 """
                 SELECT event_type, COUNT(*) as event_count
-                FROM events_medium
+                FROM {events}
                 GROUP BY event_type
                 ORDER BY event_count DESC
             """,
@@ -144,8 +433,8 @@ class PerformanceBenchmark:
                     event_type,
                     COUNT(*) as event_count,
                     COUNT(DISTINCT user_id) as unique_users,
-                    AVG(CAST(properties->>'duration' AS INTEGER)) as avg_duration
-                FROM events_medium
+                    AVG(duration_seconds) as avg_duration
+                FROM {events}
                 WHERE timestamp >= CURRENT_DATE - INTERVAL '30 days'
                 GROUP BY event_type
                 HAVING COUNT(*) > 100
@@ -153,32 +442,36 @@ class PerformanceBenchmark:
             """,
             ),
             (
+                # Hash join of per-user daily activity against per-user totals
+                # on user_id (~50K build rows). Returns the 1,000 busiest
+                # user-days with each day's share of that user's activity.
                 "join_operation",
                 """
                 WITH daily_stats AS (
                     SELECT
                         DATE(timestamp) as event_date,
-                        event_type,
+                        user_id,
                         COUNT(*) as daily_count
-                    FROM events_medium
-                    GROUP BY DATE(timestamp), event_type
+                    FROM {events}
+                    GROUP BY DATE(timestamp), user_id
                 ),
                 user_stats AS (
                     SELECT
                         user_id,
                         COUNT(*) as total_events
-                    FROM events_medium
+                    FROM {events}
                     GROUP BY user_id
                 )
                 SELECT
                     d.event_date,
-                    d.event_type,
+                    d.user_id,
                     d.daily_count,
-                    u.total_events
+                    u.total_events,
+                    d.daily_count / u.total_events as activity_share
                 FROM daily_stats d
-                LEFT JOIN user_stats u ON d.daily_count > 100
-                WHERE d.daily_count > 50
-                ORDER BY d.event_date DESC, d.daily_count DESC
+                JOIN user_stats u ON d.user_id = u.user_id
+                WHERE d.daily_count > 1
+                ORDER BY d.daily_count DESC, d.event_date DESC, d.user_id
                 LIMIT 1000
             """,
             ),
@@ -191,7 +484,7 @@ class PerformanceBenchmark:
                     timestamp,
                     ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY timestamp DESC) as event_rank,
                     LAG(timestamp, 1) OVER (PARTITION BY user_id ORDER BY timestamp) as prev_event
-                FROM events_medium
+                FROM {events}
                 WHERE user_id IS NOT NULL
                 AND timestamp >= CURRENT_DATE - INTERVAL '7 days'
                 LIMIT 10000
@@ -203,60 +496,56 @@ class PerformanceBenchmark:
                 SELECT
                     event_type,
                     COUNT(*) as total_events,
-                    COUNT(CASE WHEN properties->>'page_url' LIKE '%product%' THEN 1 END) as product_pages,
-                    AVG(LENGTH(properties->>'page_title')) as avg_title_length
-                FROM events_medium
-                WHERE properties IS NOT NULL
+                    COUNT(CASE WHEN page_url LIKE '%product%' THEN 1 END) as product_pages,
+                    AVG(LENGTH(page_title)) as avg_title_length
+                FROM {events}
+                WHERE page_url IS NOT NULL
                 GROUP BY event_type
             """,
             ),
         ]
 
-        # Adapt queries based on available views
-        try:
-            existing_views = connection.execute("""
-                SELECT table_name FROM information_schema.tables
-                WHERE table_schema = 'main' AND table_type = 'VIEW'
-            """).fetchall()
-            view_names = [row[0] for row in existing_views]
-
-            # Use available views if they exist
-            if "test_aggregation" in view_names:
-                benchmark_queries.append(
-                    ("view_aggregation", "SELECT * FROM test_aggregation LIMIT 1000")
-                )
-            if "test_join" in view_names:
-                benchmark_queries.append(
-                    ("view_join", "SELECT * FROM test_join LIMIT 1000")
-                )
-            if "funnel_analysis" in view_names:
-                benchmark_queries.append(
-                    ("analytics_funnel", "SELECT * FROM funnel_analysis")
-                )
-
-        except Exception as e:
-            print(f"  ⚠️  Could not check available views: {e}")
-
-        # Run all benchmarks
-        for query_name, query_sql in benchmark_queries:
-            result = self.run_benchmark_query(connection, query_name, query_sql)
-            self.results["benchmarks"].append(result)
+        return [(name, sql.format(events=source)) for name, sql in benchmark_queries]
+
+    def compute_fingerprint(self, pragmas, dataset_path, source):
+        """Hash everything that determines this run's results.
+
+        Covers the pragmas the queries run under, the dataset file and its
+        modification time, the query texts and the sampling options, so an
+        identical re-run can reuse the previously saved results.
+        """
+        payload = json.dumps(
+            {
+                "pragmas": pragmas,
+                "dataset": str(dataset_path),
+                "dataset_mtime": dataset_path.stat().st_mtime_ns,
+                "queries": self.get_benchmark_queries(source),
+                "warmup": self.warmup,
+                "repetitions": self.repetitions,
+                "cold": self.cold,
+            },
+            sort_keys=True,
+        )
+        self.results["fingerprint"] = hashlib.sha256(payload.encode()).hexdigest()[:16]
+        return self.results["fingerprint"]
 
-        print("✅ Benchmark suite completed")
+    def result_path(self, output_dir="results"):
+        """Return the results file for this configuration and fingerprint."""
+        filename = (
+            f"benchmark_{self.results['config_name']}_{self.results['fingerprint']}.json"
+        )
+        return Path(output_dir) / filename
 
     def save_results(self, output_dir="results"):
         """Save benchmark results to a JSON file."""
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"benchmark_{self.results['config_name']}_{timestamp}.json"
-        filepath = output_path / filename
+        Path(output_dir).mkdir(exist_ok=True)
+        filepath = self.result_path(output_dir)
+        # Record which catalog views were present for the adaptive queries
+        self.results["available_views"] = sorted(self._view_names)
 
-        with open(filepath, "w") as f:
-            json.dump(self.results, f, indent=2)
+        write_json(self.results, filepath)
 
-        print(f"💾 Results saved to: {filepath}")
+        self.log(f"💾 Results saved to: {filepath}")
         return filepath
 
     def print_summary(self):
@@ -282,13 +571,13 @@ class PerformanceBenchmark:
             ]
 
             print(f"\n⏱️  Performance Metrics:")
-            print(f"   Average query time: {statistics.mean(durations):.3f}s")
+            print(f"   Median query time: {statistics.median(durations):.3f}s")
             print(f"   Fastest query: {min(durations):.3f}s")
             print(f"   Slowest query: {max(durations):.3f}s")
 
             if throughputs:
                 print(
-                    f"   Average throughput: {statistics.mean(throughputs):,.0f} rows/sec"
+                    f"   Median throughput: {statistics.median(throughputs):,.0f} rows/sec"
                 )
                 print(f"   Peak throughput: {max(throughputs):,.0f} rows/sec")
 
@@ -300,49 +589,208 @@ class PerformanceBenchmark:
     def compare_with_baseline(self, baseline_path):
         """Compare current results with a baseline."""
         try:
-            with open(baseline_path, "r") as f:
-                baseline = json.load(f)
+            baseline_run = read_json(baseline_path)
 
             print(f"\n📈 Comparison with baseline: {Path(baseline_path).stem}")
             print("=" * 50)
 
-            current_results = {
-                b["query_name"]: b for b in self.results["benchmarks"] if b["success"]
-            }
             baseline_results = {
-                b["query_name"]: b for b in baseline["benchmarks"] if b["success"]
+                b["query_name"]: b for b in baseline_run["benchmarks"] if b["success"]
             }
 
-            for query_name in current_results:
-                if query_name in baseline_results:
-                    current = current_results[query_name]
-                    baseline = baseline_results[query_name]
-
-                    duration_change = (
-                        (current["duration_seconds"] - baseline["duration_seconds"])
-                        / baseline["duration_seconds"]
-                        * 100
-                    )
-                    throughput_change = (
-                        (current["rows_per_second"] - baseline["rows_per_second"])
-                        / baseline["rows_per_second"]
-                        * 100
-                        if baseline["rows_per_second"] > 0
-                        else 0
-                    )
-
-                    print(f"{query_name}:")
-                    print(
-                        f"  Duration: {current['duration_seconds']:.3f}s vs {baseline['duration_seconds']:.3f}s ({duration_change:+.1f}%)"
-                    )
-                    print(
-                        f"  Throughput: {current['rows_per_second']:,.0f} vs {baseline['rows_per_second']:,.0f} rows/sec ({throughput_change:+.1f}%)"
-                    )
+            ratios = []
+            for current in self.results["benchmarks"]:
+                baseline_entry = baseline_results.get(current["query_name"])
+                if not current["success"] or baseline_entry is None:
+                    continue
+
+                current_duration = current["duration_seconds"]
+                baseline_duration = baseline_entry["duration_seconds"]
+                if current_duration > 0 and baseline_duration > 0:
+                    ratios.append(current_duration / baseline_duration)
+                duration_change = (
+                    (current_duration - baseline_duration) / baseline_duration * 100
+                    if baseline_duration > 0
+                    else 0
+                )
+                throughput_change = (
+                    (current["rows_per_second"] - baseline_entry["rows_per_second"])
+                    / baseline_entry["rows_per_second"]
+                    * 100
+                    if baseline_entry["rows_per_second"] > 0
+                    else 0
+                )
+
+                print(f"{current['query_name']}:")
+                print(
+                    f"  Duration: {current_duration:.3f}s vs {baseline_duration:.3f}s ({duration_change:+.1f}%)"
+                )
+                print(
+                    f"  Throughput: {current['rows_per_second']:,.0f} vs {baseline_entry['rows_per_second']:,.0f} rows/sec ({throughput_change:+.1f}%)"
+                )
+
+            if ratios:
+                # The geometric mean keeps one slow query from dominating the summary
+                geomean = statistics.geometric_mean(ratios)
+                print(
+                    f"\n🎯 Geometric mean duration ratio over {len(ratios)} queries: "
+                    f"{geomean:.3f}x ({(geomean - 1) * 100:+.1f}%)"
+                )
 
         except Exception as e:
             print(f"❌ Could not compare with baseline: {e}")
 
 
+class BenchmarkServer:
+    """Serve benchmark queries from one long-lived DuckDB connection.
+
+    Pragmas are applied and a view is created for every generated dataset
+    once, at startup. Each request then runs on the same warm connection, so
+    repeated evaluations skip connection setup and re-reading Parquet
+    metadata.
+
+    Clients authenticate with the shared key from ``AUTHKEY_ENV`` and can
+    only run the built-in benchmark queries: a request names a query and a
+    dataset view (plus optional ``warmup`` and ``repetitions``) and the
+    server builds the SQL itself. Replies are the usual benchmark result
+    dicts with an added ``duration_ns``. A ``{"command": "info"}`` request
+    returns the server's configuration name, pragmas and effective settings.
+    """
+
+    def __init__(self, benchmark, config, address=DEFAULT_SERVER_ADDRESS):
+        self.benchmark = benchmark
+        self.address = parse_address(address)
+        self.pragmas = benchmark.config_pragmas(config)
+        self.connection = benchmark.setup_database(config)
+        self.datasets = {}
+        for dataset_path in sorted(Path("datasets").glob("events_*.parquet")):
+            view_name = dataset_path.stem
+            if benchmark.create_events_view(
+                self.connection, view_name, benchmark.dataset_source(dataset_path)
+            ):
+                self.datasets[view_name] = dict(
+                    benchmark.get_benchmark_queries(view_name)
+                )
+
+    def info(self):
+        """Describe the configuration the server's queries run under."""
+        return {
+            "config_name": self.benchmark.results["config_name"],
+            "pragmas": self.pragmas,
+            "effective_settings": self.benchmark.results["effective_settings"],
+            "datasets": sorted(self.datasets),
+        }
+
+    def handle(self, request):
+        """Run one benchmark request and return its result."""
+        if request.get("command") == "info":
+            return self.info()
+
+        queries = self.datasets.get(request.get("dataset"))
+        if queries is None:
+            return {"success": False, "error": "Unknown dataset"}
+        query_name = request.get("query_name")
+        if query_name not in queries:
+            return {"success": False, "error": "Unknown query"}
+
+        # Omitted fields fall back to the server's own settings, never to
+        # whatever an earlier request asked for
+        try:
+            warmup = int(request.get("warmup", self.benchmark.warmup))
+            repetitions = int(request.get("repetitions", self.benchmark.repetitions))
+        except (TypeError, ValueError):
+            return {"success": False, "error": "Invalid warmup or repetitions"}
+        result = self.benchmark.run_benchmark_query(
+            self.connection,
+            query_name,
+            queries[query_name],
+            warmup=min(max(0, warmup), MAX_SERVER_RUNS),
+            repetitions=min(max(1, repetitions), MAX_SERVER_RUNS),
+        )
+        result["duration_ns"] = int(result["duration_seconds"] * 1e9)
+        return result
+
+    def serve_forever(self):
+        """Accept client connections until interrupted."""
+        authkey = os.environ.get(AUTHKEY_ENV)
+        if not authkey:
+            authkey = secrets.token_hex(16)
+            # Printed even with --quiet; clients cannot connect without it
+            print(f"🔑 Clients must set: export {AUTHKEY_ENV}={authkey}")
+
+        host, port = self.address
+        self.benchmark.log(f"\n📡 Benchmark server listening on {host}:{port} (Ctrl+C to stop)")
+        try:
+            with Listener(self.address, authkey=authkey.encode()) as listener:
+                while True:
+                    try:
+                        conn = listener.accept()
+                    except AuthenticationError:
+                        print("⚠️  Rejected a client with the wrong auth key")
+                        continue
+                    with conn:
+                        while True:
+                            try:
+                                request = conn.recv()
+                            except EOFError:
+                                break
+                            if not isinstance(request, dict):
+                                break
+                            conn.send(self.handle(request))
+        except KeyboardInterrupt:
+            self.benchmark.log("\n👋 Benchmark server stopped")
+        finally:
+            self.connection.close()
+
+
+def parse_address(address):
+    """Parse a ``host:port`` string into a listener address tuple."""
+    if isinstance(address, tuple):
+        return address
+    host, _, port = address.rpartition(":")
+    return (host or "localhost", int(port))
+
+
+def connect_to_server(address=DEFAULT_SERVER_ADDRESS):
+    """Open an authenticated connection to a running ``BenchmarkServer``."""
+    authkey = os.environ.get(AUTHKEY_ENV)
+    if not authkey:
+        raise AuthenticationError(
+            f"{AUTHKEY_ENV} is not set; use the key printed by --serve"
+        )
+    return Client(parse_address(address), authkey=authkey.encode())
+
+
+def fetch_server_info(conn):
+    """Ask the server which configuration its connection runs under."""
+    conn.send({"command": "info"})
+    return conn.recv()
+
+
+def run_client_benchmark(benchmark, conn, dataset):
+    """Run the core benchmark queries against ``dataset`` on the server."""
+    benchmark.log("🏃‍♂️ Running performance benchmark suite on server...")
+    for query_name, _ in benchmark.get_benchmark_queries(dataset):
+        conn.send(
+            {
+                "query_name": query_name,
+                "dataset": dataset,
+                "warmup": benchmark.warmup,
+                "repetitions": benchmark.repetitions,
+            }
+        )
+        result = conn.recv()
+        if result["success"]:
+            benchmark.log(
+                f"  📊 {query_name}: {result['duration_seconds']:.3f}s median, "
+                f"{result['rows_returned']:,} rows"
+            )
+        else:
+            print(f"  📊 {query_name}: ❌ Failed: {result['error']}")
+        benchmark.results["benchmarks"].append(result)
+    benchmark.log("✅ Benchmark suite completed")
+
+
 def main():
     """Main benchmark execution function."""
     parser = argparse.ArgumentParser(description="DuckDB Performance Benchmark")
@@ -363,6 +811,50 @@ def main():
     parser.add_argument(
         "--list-results", action="store_true", help="List all available result files"
     )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=1,
+        help="Unmeasured runs per query before sampling (default: 1)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Measured runs per query; the median is reported (default: 5)",
+    )
+    parser.add_argument(
+        "--cold",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Disable DuckDB caches and skip warm-up to measure cold reads",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-run even if results for this exact configuration already exist",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep one configured connection open and serve benchmark queries",
+    )
+    mode.add_argument(
+        "--client",
+        action="store_true",
+        help="Run the benchmark queries on a server started with --serve",
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Suppress progress output and print only the results file path",
+    )
+    parser.add_argument(
+        "--address",
+        default=DEFAULT_SERVER_ADDRESS,
+        help=f"host:port for --serve/--client (default: {DEFAULT_SERVER_ADDRESS})",
+    )
 
     args = parser.parse_args()
 
@@ -381,22 +873,30 @@ def main():
             print(f"📁 Results directory {args.output} does not exist")
         return
 
-    print("🚀 DuckDB Performance Benchmark")
-    print("=" * 50)
-    print(f"Configuration: {args.config}")
-    print(f"Dataset: {args.dataset}")
-
     # Initialize benchmark
-    benchmark = PerformanceBenchmark(args.config, args.dataset)
+    benchmark = PerformanceBenchmark(
+        args.config,
+        args.dataset,
+        warmup=args.warmup,
+        repetitions=args.repeat,
+        cold=args.cold,
+        quiet=args.quiet,
+    )
+
+    benchmark.log("🚀 DuckDB Performance Benchmark")
+    benchmark.log("=" * 50)
+    benchmark.log(f"Configuration: {args.config}")
+    benchmark.log(f"Dataset: {args.dataset}")
 
     # Load configuration
     config = benchmark.load_config()
     if config is None:
         sys.exit(1)
 
-    # Set up database
-    print("\n🔧 Setting up database with performance settings...")
-    connection = benchmark.setup_database(config)
+    if args.serve:
+        benchmark.log("\n🔧 Setting up database with performance settings...")
+        BenchmarkServer(benchmark, config, args.address).serve_forever()
+        return
 
     # Check dataset availability
     dataset_path = Path("datasets") / f"events_{args.dataset}.parquet"
@@ -406,28 +906,81 @@ def main():
         )
         sys.exit(1)
 
-    print(f"✅ Using dataset: {dataset_path}")
+    benchmark.log(f"✅ Using dataset: {dataset_path}")
 
-    # Load dataset into view
-    try:
-        view_name = f"events_{args.dataset}"
-        connection.execute(
-            f"CREATE OR REPLACE VIEW {view_name} AS SELECT * FROM '{dataset_path}'"
+    server = None
+    if args.client:
+        # The server's connection, not --config, determines what is measured
+        try:
+            server = connect_to_server(args.address)
+        except ConnectionRefusedError:
+            print(
+                f"❌ No benchmark server at {args.address}. "
+                "Start one with 'python benchmark.py --config ... --serve'."
+            )
+            sys.exit(1)
+        except AuthenticationError as e:
+            print(f"❌ Could not authenticate with the benchmark server: {e}")
+            sys.exit(1)
+        info = fetch_server_info(server)
+        source = f"events_{args.dataset}"
+        if source not in info["datasets"]:
+            print(f"❌ The benchmark server has no {source} view.")
+            sys.exit(1)
+        pragmas = info["pragmas"]
+        benchmark.results["config_name"] = info["config_name"]
+        benchmark.results["effective_settings"] = info["effective_settings"]
+        benchmark.log(f"📡 Server configuration: {info['config_name']}")
+    else:
+        source = benchmark.dataset_source(dataset_path)
+        pragmas = benchmark.config_pragmas(config)
+
+    # Skip the run when this exact configuration was already benchmarked
+    fingerprint = benchmark.compute_fingerprint(pragmas, dataset_path, source)
+    results_path = benchmark.result_path(args.output)
+    if results_path.exists() and not args.force:
+        if server is not None:
+            server.close()
+        benchmark.log(
+            f"♻️  Results for fingerprint {fingerprint} already exist: {results_path}"
         )
-        print(f"✅ Created view {view_name}")
-    except Exception as e:
-        print(f"❌ Failed to create view: {e}")
-        sys.exit(1)
+        benchmark.log("   Use --force to run the benchmark again.")
+        if args.compare:
+            benchmark.results = read_json(results_path)
+            benchmark.compare_with_baseline(args.compare)
+        if args.quiet:
+            sys.stdout.write(f"{results_path}\n")
+            sys.stdout.flush()
+        return
+
+    if server is not None:
+        # The server already holds a configured connection
+        connection = None
+    else:
+        # Set up database
+        benchmark.log("\n🔧 Setting up database with performance settings...")
+        connection = benchmark.setup_database(config)
+
+        # Expose the dataset both as a direct scan and, for catalog views, by name
+        if not benchmark.create_events_view(
+            connection, f"events_{args.dataset}", source
+        ):
+            sys.exit(1)
 
     # Run benchmark
-    print("\n" + "=" * 50)
-    start_time = time.time()
-    benchmark.run_full_benchmark(connection)
-    total_time = time.time() - start_time
+    benchmark.log("\n" + "=" * 50)
+    start_ns = time.perf_counter_ns()
+    if server is not None:
+        with server:
+            run_client_benchmark(benchmark, server, source)
+    else:
+        benchmark.run_full_benchmark(connection, source)
+    total_time = (time.perf_counter_ns() - start_ns) / 1e9
 
     # Print summary
-    benchmark.print_summary()
-    print(f"\n⏱️  Total benchmark time: {total_time:.2f}s")
+    if not args.quiet:
+        benchmark.print_summary()
+    benchmark.log(f"\n⏱️  Total benchmark time: {total_time:.2f}s")
 
     # Save results
     results_path = benchmark.save_results(args.output)
@@ -437,7 +990,14 @@ def main():
         benchmark.compare_with_baseline(args.compare)
 
     # Close connection
-    connection.close()
+    if connection is not None:
+        connection.close()
+
+    if args.quiet:
+        # One write and flush for scripts that capture the results path
+        sys.stdout.write(f"{results_path}\n")
+        sys.stdout.flush()
+        return
 
     print(f"\n🎉 Benchmark completed!")
     print(f"📊 Results saved to: {results_path}")
@@ -13,121 +13,191 @@ import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
 
-import numpy as np
-import polars as pl
-import pyarrow.dataset as ds
-
-
-def create_events_dataset(num_rows):
-    """Generate synthetic events data for performance testing."""
-    print(f"📊 Generating {num_rows:,} events dataset...")
-
-    np.random.seed(42)  # For reproducible results
-
-    event_types = [
-        "page_view", "click", "form_submit", "signup", "login", "logout",
-        "purchase", "add_to_cart", "search", "download", "share", "comment"
-    ]
-
-    user_segments = ["free", "premium", "enterprise"]
-    browsers = ["Chrome", "Firefox", "Safari", "Edge", "Mobile Safari"]
-    referrers = ["direct", "google", "facebook", "twitter", "linkedin", "email", "organic"]
-    page_categories = ["home", "product", "blog", "about", "contact", "pricing", "docs"]
-
-    start_date = datetime.now() - timedelta(days=365)
-
-    batch_size = 50_000
-    total_batches = (num_rows + batch_size - 1) // batch_size
-
-    batches: list[pl.DataFrame] = []
-
-    for batch_num in range(total_batches):
-        start_idx = batch_num * batch_size
-        end_idx = min(start_idx + batch_size, num_rows)
-        current_batch_size = end_idx - start_idx
-
-        days_ago = np.random.exponential(scale=90, size=current_batch_size)
-        days_ago = np.clip(days_ago, 0, 365)
-        timestamps = [start_date + timedelta(days=int(day)) for day in days_ago]
-
-        batch = pl.DataFrame(
-            {
-                "event_id": [f"evt_{start_idx + i:08d}" for i in range(current_batch_size)],
-                "timestamp": timestamps,
-                "event_type": np.random.choice(event_types, current_batch_size, p=[
-                    0.35, 0.20, 0.10, 0.05, 0.08, 0.07, 0.03, 0.04, 0.03, 0.02, 0.02, 0.01
-                ]),
-                "user_id": [f"user_{np.random.randint(1, 50000):05d}" for _ in range(current_batch_size)],
-                "session_id": [f"sess_{np.random.randint(1, 20000):05d}" for _ in range(current_batch_size)],
-                "properties": [generate_event_properties() for _ in range(current_batch_size)],
-            }
-        )
+import duckdb
+
+
+EVENT_TYPES = [
+    "page_view", "click", "form_submit", "signup", "login", "logout",
+    "purchase", "add_to_cart", "search", "download", "share", "comment"
+]
+EVENT_TYPE_PROBS = [0.35, 0.20, 0.10, 0.05, 0.08, 0.07, 0.03, 0.04, 0.03, 0.02, 0.02, 0.01]
+
+BASE_SEED = 42  # For reproducible results
+ROW_GROUP_SIZE = 122_880
+
+PAGE_SECTIONS = ["page", "product", "blog"]
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1",
+]
+REFERRER_URLS = ["direct", "https://google.com", "https://facebook.com", "https://twitter.com", "https://linkedin.com"]
+BUTTON_TEXTS = ["Submit", "Buy Now", "Learn More", "Sign Up"]
+
+# Event-specific payload variants: duration, revenue, form, search, button, none
+PROPERTY_VARIANT_PROBS = [0.3, 0.2, 0.2, 0.15, 0.1, 0.05]
+
+# Deterministic per-row random numbers. random() depends on thread
+# scheduling, so draws are hashed from (row, stream, seed) instead; every
+# column uses its own stream name to stay independent of the others.
+RANDOM_MACROS_SQL = f"""
+CREATE OR REPLACE MACRO uniform(i, stream) AS
+    hash(i, stream, {BASE_SEED}) / 18446744073709551616.0;
+CREATE OR REPLACE MACRO randint(i, stream, lo, hi) AS
+    lo + floor(uniform(i, stream) * (hi - lo))::BIGINT;
+"""
 
-        batches.append(batch)
 
-        if batch_num % 10 == 0:
-            print(f"  Generated {end_idx:,} / {num_rows:,} rows...")
+def _sql_list(values):
+    """Render a Python list of strings as a DuckDB list literal."""
+    return "[" + ", ".join("'" + v.replace("'", "''") + "'" for v in values) + "]"
 
-    print("  Combining batches...")
-    df = pl.concat(batches, how="vertical") if len(batches) > 1 else batches[0]
 
-    return df
+def _weighted_choice_sql(draw, values, probs):
+    """Map a uniform draw onto ``values`` with the given probabilities."""
+    cases = []
+    cumulative = 0.0
+    for value, prob in zip(values[:-1], probs[:-1]):
+        cumulative += prob
+        cases.append(f"WHEN {draw} < {cumulative:.6f} THEN {value}")
+    return f"CASE {' '.join(cases)} ELSE {values[-1]} END"
 
 
-def generate_event_properties():
-    """Generate realistic JSON properties for events."""
-    properties = {
-        "page_url": f"https://example.com/{np.random.choice(['page', 'product', 'blog'])}/{np.random.randint(1, 1000)}",
-        "user_agent": np.random.choice([
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 14_6 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1"
-        ]),
-        "ip_address": f"{np.random.randint(1, 256)}.{np.random.randint(1, 256)}.{np.random.randint(1, 256)}.{np.random.randint(1, 256)}",
-        "referrer": np.random.choice(["direct", "https://google.com", "https://facebook.com", "https://twitter.com", "https://linkedin.com"]),
-        "page_title": f"Page Title {np.random.randint(1, 5000)}"
-    }
+def events_query(num_rows, start_date):
+    """Build the SQL that generates ``num_rows`` synthetic events.
 
-    # Add event-specific properties
-    event_specific = np.random.choice([
-        {"duration": str(np.random.randint(10, 3000))},
-        {"revenue": f"{np.random.uniform(0.99, 999.99):.2f}"},
-        {"form_field": "email", "form_value": f"user{np.random.randint(1, 10000)}@example.com"},
-        {"search_query": f"search term {np.random.randint(1, 1000)}"},
-        {"button_text": np.random.choice(["Submit", "Buy Now", "Learn More", "Sign Up"])},
-        {}
-    ], p=[0.3, 0.2, 0.2, 0.15, 0.1, 0.05])
-
-    properties.update(event_specific)
-    return str(properties).replace("'", '"')  # Convert to JSON-like string
-
-
-def write_partitioned_dataset(df: pl.DataFrame, base_dir: Path, partition_cols: list[str]) -> None:
-    """Write a DataFrame as a partitioned Parquet dataset using pyarrow."""
-    base_dir.mkdir(parents=True, exist_ok=True)
-    partitioning = ds.partitioning(partition_cols, flavor="hive") if partition_cols else None
-    ds.write_dataset(
-        df.to_arrow(),
-        base_dir,
-        format="parquet",
-        partitioning=partitioning,
-        existing_data_behavior="delete_matching",
+    Every column is derived from the row number in a single vectorized
+    DuckDB plan, so no rows pass through Python. Timestamps are skewed by an
+    inverse-CDF exponential (mean 90 days) clipped at 365 days. The fields
+    queries filter and aggregate on are also written as typed columns so
+    readers can scan them without parsing the JSON properties.
+    """
+    event_type = _weighted_choice_sql(
+        "uniform(i, 'event_type')", [f"'{t}'" for t in EVENT_TYPES], EVENT_TYPE_PROBS
+    )
+    variant = _weighted_choice_sql(
+        "uniform(i, 'variant')",
+        [str(n) for n in range(len(PROPERTY_VARIANT_PROBS))],
+        PROPERTY_VARIANT_PROBS,
     )
+    return f"""
+WITH seeds AS (
+    SELECT
+        'evt_' || lpad(i::VARCHAR, 8, '0') AS event_id,
+        TIMESTAMP '{start_date:%Y-%m-%d %H:%M:%S.%f}'
+            + to_days(least(floor(-90 * ln(1 - uniform(i, 'days'))), 365)::INTEGER) AS timestamp,
+        {event_type} AS event_type,
+        'user_' || lpad(randint(i, 'user', 1, 50000)::VARCHAR, 5, '0') AS user_id,
+        'sess_' || lpad(randint(i, 'session', 1, 20000)::VARCHAR, 5, '0') AS session_id,
+        randint(i, 'page_section', 0, {len(PAGE_SECTIONS)}) AS page_section,
+        randint(i, 'page_id', 1, 1000) AS page_id,
+        randint(i, 'user_agent', 0, {len(USER_AGENTS)}) AS ua_idx,
+        randint(i, 'ip1', 1, 256) AS ip1,
+        randint(i, 'ip2', 1, 256) AS ip2,
+        randint(i, 'ip3', 1, 256) AS ip3,
+        randint(i, 'ip4', 1, 256) AS ip4,
+        randint(i, 'referrer', 0, {len(REFERRER_URLS)}) AS ref_idx,
+        randint(i, 'title', 1, 5000) AS title_id,
+        {variant} AS variant,
+        randint(i, 'duration', 10, 3000) AS duration,
+        0.99 + uniform(i, 'revenue') * (999.99 - 0.99) AS revenue,
+        randint(i, 'form_user', 1, 10000) AS form_user,
+        randint(i, 'search_term', 1, 1000) AS search_term,
+        randint(i, 'button', 0, {len(BUTTON_TEXTS)}) AS button_idx
+    FROM range({num_rows}) t(i)
+),
+typed AS (
+    SELECT
+        *,
+        'https://example.com/' || {_sql_list(PAGE_SECTIONS)}[page_section + 1] || '/' || page_id AS page_url,
+        'Page Title ' || title_id AS page_title,
+        CASE WHEN variant = 0 THEN duration::INTEGER END AS duration_seconds,
+        CASE WHEN variant = 1 THEN round(revenue, 2) END AS revenue_amount
+    FROM seeds
+)
+SELECT
+    event_id,
+    timestamp,
+    event_type,
+    user_id,
+    session_id,
+    -- Every value is a fixed literal or a number, so plain concatenation
+    -- yields valid JSON without json_object's per-row overhead
+    '{{"page_url":"' || page_url
+        || '","user_agent":"' || {_sql_list(USER_AGENTS)}[ua_idx + 1]
+        || '","ip_address":"' || concat_ws('.', ip1, ip2, ip3, ip4)
+        || '","referrer":"' || {_sql_list(REFERRER_URLS)}[ref_idx + 1]
+        || '","page_title":"' || page_title || '"'
+        || CASE variant
+            WHEN 0 THEN ',"duration":"' || duration || '"'
+            WHEN 1 THEN ',"revenue":"' || printf('%.2f', revenue) || '"'
+            WHEN 2 THEN ',"form_field":"email","form_value":"user' || form_user || '@example.com"'
+            WHEN 3 THEN ',"search_query":"search term ' || search_term || '"'
+            WHEN 4 THEN ',"button_text":"' || {_sql_list(BUTTON_TEXTS)}[button_idx + 1] || '"'
+            ELSE ''
+        END
+        || '}}' AS properties,
+    duration_seconds,
+    page_url,
+    page_title,
+    revenue_amount::DOUBLE AS revenue,
+    year(timestamp) AS year,
+    month(timestamp) AS month
+FROM typed
+"""
+
+
+def connect_generator(threads=None):
+    """Open an in-memory DuckDB connection with the random-draw macros defined."""
+    con = duckdb.connect(":memory:")
+    if threads:
+        con.execute(f"SET threads = {int(threads)}")
+    con.execute(RANDOM_MACROS_SQL)
+    return con
 
 
 def write_outputs(
-    df: pl.DataFrame,
+    con,
+    query: str,
     single_path: Path,
     partition_dir: Path,
     partitioned: bool,
     partitioned_only: bool,
 ) -> None:
+    """Write generated events to the single-file and/or partitioned outputs.
+
+    DuckDB's parallel Parquet writer consumes the query directly, so the
+    dataset is never materialized in Python.
+    """
     if not partitioned_only:
         single_path.parent.mkdir(parents=True, exist_ok=True)
-        df.write_parquet(single_path, compression="zstd")
+        con.execute(
+            f"""
+            COPY ({query}) TO '{single_path.as_posix()}'
+            (FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE {ROW_GROUP_SIZE})
+            """
+        )
 
     if partitioned:
-        write_partitioned_dataset(df, partition_dir, ["year", "month"])
+        # Re-read the file just written rather than generating the rows twice
+        source = query if partitioned_only else f"SELECT * FROM read_parquet('{single_path.as_posix()}')"
+        con.execute(
+            f"""
+            COPY ({source}) TO '{partition_dir.as_posix()}'
+            (FORMAT PARQUET, COMPRESSION ZSTD, PARTITION_BY (year, month), OVERWRITE)
+            """
+        )
+
+
+def summarize_dataset(con, parquet_glob: str):
+    """Return row count, date range and distinct counts for written Parquet files."""
+    return con.execute(
+        f"""
+        SELECT COUNT(*), MIN(timestamp), MAX(timestamp),
+               COUNT(DISTINCT event_type), COUNT(DISTINCT user_id)
+        FROM read_parquet('{parquet_glob}')
+        """
+    ).fetchone()
 
 
 def create_directory_structure():
@@ -176,6 +246,12 @@ def main():
         action="store_true",
         help="Overwrite existing datasets"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="DuckDB threads used for generation (default: number of CPU cores)",
+    )
     parser.add_argument(
         "--partitioned",
         action="store_true",
@@ -236,17 +312,16 @@ def main():
         print(f"   Estimated size: ~{dataset_size_mb:.0f} MB")
 
         start_time = time.time()
-        df = create_events_dataset(config["rows"])
-        df_with_partitions = df.with_columns(
-            pl.col("timestamp").dt.year().alias("year"),
-            pl.col("timestamp").dt.month().alias("month"),
-        )
 
         single_output = Path("datasets") / config["filename"]
         partition_dir = Path("datasets") / f"{config['filename'].replace('.parquet', '')}_partitioned"
 
+        print(f"📊 Generating {config['rows']:,} events dataset...")
+        start_date = datetime.now() - timedelta(days=365)
+        con = connect_generator(threads=args.workers or cpu_cores or None)
         write_outputs(
-            df_with_partitions,
+            con,
+            events_query(config["rows"], start_date),
             single_output,
             partition_dir,
             partitioned=args.partitioned,
@@ -256,7 +331,11 @@ def main():
         end_time = time.time()
 
         duration = end_time - start_time
-        actual_rows = df.height
+        summary_glob = (
+            f"{partition_dir}/**/*.parquet" if args.partitioned_only else str(single_output)
+        )
+        actual_rows, min_ts, max_ts, n_event_types, n_users = summarize_dataset(con, summary_glob)
+        con.close()
         rows_per_second = actual_rows / duration if duration else actual_rows
 
         print(f"   ✅ Completed in {duration:.1f}s ({rows_per_second:,.0f} rows/sec)")
@@ -266,8 +345,8 @@ def main():
         if args.partitioned:
             print(f"   ✅ Partitioned output: {partition_dir}")
         print(
-            f"   ✅ Date range: {df['timestamp'].min()} to {df['timestamp'].max()} | "
-            f"Event types: {df['event_type'].n_unique()} | Users: {df['user_id'].n_unique()}"
+            f"   ✅ Date range: {min_ts} to {max_ts} | "
+            f"Event types: {n_event_types} | Users: {n_users}"
         )
         print()
 
@@ -7,187 +7,431 @@ DuckDB configuration settings.
 """
 
 import os
+import re
 import sys
 import json
-import subprocess
+import time
+import functools
+import importlib
+from importlib import metadata
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from datetime import datetime
 import argparse
 
+import yaml
+
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as Dumper
+
+
+class _ConfigDumper(Dumper):
+    """Safe dumper that writes tuples (the frozen extension lists) as plain YAML lists."""
+
+
+_ConfigDumper.add_representer(tuple, _ConfigDumper.represent_list)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Multiplier converting a byte count to GiB
+_GIB = 1.0 / (1 << 30)
+
+# Reusable system profile for --cache-profile
+PROFILE_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or "~/.cache").expanduser() / "duckalog" / "system_profile.json"
+)
+PROFILE_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+# Supported workloads and the PerformanceTuner method configuring each one
+_WORKLOADS = {
+    "general": "_configure_general",
+    "analytics": "_configure_analytics",
+    "concurrent": "_configure_concurrent",
+    "memory_constrained": "_configure_memory_constrained",
+}
+
+# Extensions installed for each workload
+_DEFAULT_EXTENSIONS = ("httpfs", "parquet", "json")
+_ANALYTICS_EXTENSIONS = (*_DEFAULT_EXTENSIONS, "fts")  # FTS for text analytics
+_MEMORY_CONSTRAINED_EXTENSIONS = ("parquet",)  # Minimal extensions to reduce memory usage
+
+# Workload pragma templates, one pragma per line. System-dependent values
+# are filled in with a single %-format call by _render_pragmas.
+_GENERAL_PRAGMA_TEMPLATE = "\n".join((
+    "SET memory_limit='%(memory_limit_gb)sGB'",
+    "SET threads=%(threads)s",
+    "SET enable_optimizer=true",
+    "SET enable_optimizer_caching=true",
+    "SET force_parallelism=true",
+    "SET enable_progress_bar=true",
+))
+_ANALYTICS_PRAGMA_TEMPLATE = "\n".join((
+    "SET memory_limit='%(memory_limit_gb)sGB'",
+    "SET threads=%(threads)s",
+    "SET enable_memory_map=true",
+    "SET enable_optimizer=true",
+    "SET enable_optimizer_caching=true",
+    "SET force_parallelism=true",
+    "SET enable_profiling=true",
+    "SET enable_join_order=true",
+    "SET enable_propagate_null_elimination=true",
+    "SET enable_distinct_projection_optimization=true",
+))
+_CONCURRENT_PRAGMA_TEMPLATE = "\n".join((
+    "SET memory_limit='%(memory_limit_gb)sGB'",
+    "SET threads=%(threads)s",
+    "SET enable_optimizer=true",
+    "SET enable_optimizer_caching=true",
+    "SET force_parallelism=false",  # Let DuckDB decide for concurrent workloads
+    "SET enable_object_cache=true",
+    "SET wal_autocheckpoint=250000",
+    "SET checkpoint_threshold='500MB'",
+))
+_MEMORY_CONSTRAINED_PRAGMA_TEMPLATE = "\n".join((
+    "SET memory_limit='%(memory_limit_gb)sGB'",
+    "SET threads=2",  # Limited threads to reduce memory pressure
+    "SET enable_optimizer=true",
+    "SET enable_optimizer_caching=false",  # Disable caching to save memory
+    "SET force_parallelism=false",
+    "SET enable_progress_bar=true",
+    "SET checkpoint_threshold='100MB'",
+    "SET enable_profiling=false",  # Disable profiling to save resources
+))
+
+
+@dataclass(slots=True, frozen=True)
+class SystemInfo:
+    """Resources reported by SystemProfiler."""
+
+    cpu_physical_cores: int
+    cpu_logical_cores: int
+    cpu_threads_per_core: int
+    memory_total_gb: float
+    memory_available_gb: float
+    memory_usage_percent: float
+    storage_total_gb: float
+    storage_free_gb: float
+    duckdb_version: str
+
+
+@dataclass(slots=True, frozen=True)
+class Recommendation:
+    """A single tuning recommendation."""
+
+    category: str
+    priority: str
+    message: str
+
+
+# (predicate, recommendation) pairs checked against the system profile
+_RECS = (
+    (
+        lambda si: si.memory_total_gb < 4,
+        Recommendation(
+            category="Memory",
+            priority="High",
+            message="Low memory detected. Consider using memory_constrained configuration or upgrading RAM.",
+        ),
+    ),
+    (
+        lambda si: si.memory_total_gb >= 16,
+        Recommendation(
+            category="Memory",
+            priority="Info",
+            message="High memory available. Consider analytics configuration for best performance.",
+        ),
+    ),
+    (
+        lambda si: si.cpu_logical_cores < 4,
+        Recommendation(
+            category="CPU",
+            priority="Medium",
+            message="Limited CPU cores. Performance will benefit from more cores for parallel queries.",
+        ),
+    ),
+)
+# Recommendations that apply to every system
+_STATIC_RECS = (
+    Recommendation(
+        category="Storage",
+        priority="Info",
+        message="Use fast SSD storage for temporary files and databases.",
+    ),
+    Recommendation(
+        category="Configuration",
+        priority="Info",
+        message="Test different configurations with your actual workload for optimal results.",
+    ),
+)
+
+
+def _render_pragmas(template, params):
+    """Fill a pragma template with system-dependent values and split it into pragmas."""
+    return (template % params).split("\n")
+
+
+def _dumps(data):
+    """Format data as indented JSON, using orjson's faster encoder when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+@functools.cache
+def _load_psutil():
+    """Import psutil on first use; None when it is not installed."""
+    try:
+        return importlib.import_module("psutil")
+    except ImportError:
+        return None
+
+
+def _read_proc_cpu_counts():
+    """Return (physical, logical) core counts from /proc/cpuinfo, or None."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    logical = 0
+    cores = set()
+    for block in data.split("\n\n"):
+        fields = dict(
+            (key.strip(), value.strip())
+            for key, _, value in (line.partition(":") for line in block.splitlines())
+        )
+        if "processor" in fields:
+            logical += 1
+            if "core id" in fields:
+                cores.add((fields.get("physical id"), fields["core id"]))
+
+    if not logical:
+        return None
+    return len(cores) or logical, logical
+
+
+def _read_proc_meminfo():
+    """Return (total, available) memory in bytes from /proc/meminfo, or None."""
+    try:
+        with open("/proc/meminfo") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    total = re.search(r"^MemTotal:\s+(\d+)", data, re.MULTILINE)
+    available = re.search(r"^MemAvailable:\s+(\d+)", data, re.MULTILINE)
+    if total is None or available is None:
+        return None
+    return int(total.group(1)) * 1024, int(available.group(1)) * 1024
+
 
 class SystemProfiler:
-    """Profile system resources and capabilities."""
+    """Profile system resources and capabilities.
+
+    Linux systems are read directly from /proc and statvfs; psutil is only
+    imported when those are unavailable.
+    """
 
-    def __init__(self):
-        self.system_info = {}
+    def __init__(self, log=print):
+        self.system_info = None
+        self._log = log
 
     def profile(self):
         """Profile the current system."""
-        print("🔍 Profiling system resources...")
-
-        # CPU Information
-        self._profile_cpu()
+        self._log("🔍 Profiling system resources...")
 
-        # Memory Information
-        self._profile_memory()
+        # CPU, memory, storage and DuckDB probes hit independent subsystems,
+        # so run them concurrently and merge their results in a fixed order
+        probes = (self._profile_cpu, self._profile_memory, self._profile_storage, self._profile_duckdb)
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            results = list(executor.map(lambda probe: probe(), probes))
 
-        # Storage Information
-        self._profile_storage()
-
-        # DuckDB Version
-        self._profile_duckdb()
+        info = {}
+        for probe_info, message in results:
+            info.update(probe_info)
+            self._log(f"  {message}")
 
+        self.system_info = SystemInfo(**info)
         return self.system_info
 
     def _profile_cpu(self):
         """Profile CPU information."""
-        try:
-            import psutil
-            cpu_count = psutil.cpu_count(logical=False)  # Physical cores
-            cpu_count_logical = psutil.cpu_count(logical=True)  # Logical cores
+        counts = _read_proc_cpu_counts()
+        if counts is None:
+            psutil = _load_psutil()
+            if psutil is not None:
+                counts = (psutil.cpu_count(logical=False), psutil.cpu_count(logical=True))
 
-            self.system_info.update({
+        if counts is not None and counts[0]:
+            cpu_count, cpu_count_logical = counts  # Physical and logical cores
+
+            info = {
                 "cpu_physical_cores": cpu_count,
                 "cpu_logical_cores": cpu_count_logical,
-                "cpu_threads_per_core": cpu_count_logical // cpu_count if cpu_count > 0 else 1
-            })
+                "cpu_threads_per_core": cpu_count_logical // cpu_count
+            }
 
-            print(f"  CPU: {cpu_count} physical cores, {cpu_count_logical} logical cores")
+            return info, f"CPU: {cpu_count} physical cores, {cpu_count_logical} logical cores"
 
-        except ImportError:
-            # Fallback to basic CPU detection
-            try:
-                result = subprocess.run(['nproc'], capture_output=True, text=True)
-                cpu_count = int(result.stdout.strip())
-                self.system_info.update({
+        else:
+            # Fallback to basic CPU detection, honoring the CPU affinity mask
+            if hasattr(os, "sched_getaffinity"):
+                cpu_count = len(os.sched_getaffinity(0))
+            else:
+                cpu_count = os.cpu_count()
+
+            if cpu_count:
+                info = {
                     "cpu_physical_cores": cpu_count,
                     "cpu_logical_cores": cpu_count,
                     "cpu_threads_per_core": 1
-                })
-                print(f"  CPU: {cpu_count} cores (basic detection)")
-            except:
-                self.system_info.update({
+                }
+                return info, f"CPU: {cpu_count} cores (basic detection)"
+            else:
+                info = {
                     "cpu_physical_cores": 4,  # Conservative default
                     "cpu_logical_cores": 4,
                     "cpu_threads_per_core": 1
-                })
-                print("  CPU: Using default values (4 cores)")
+                }
+                return info, "CPU: Using default values (4 cores)"
 
     def _profile_memory(self):
         """Profile memory information."""
-        try:
-            import psutil
-            memory = psutil.virtual_memory()
+        memory = _read_proc_meminfo()
+        if memory is None:
+            psutil = _load_psutil()
+            if psutil is not None:
+                snapshot = psutil.virtual_memory()
+                memory = (snapshot.total, snapshot.available)
 
-            total_gb = memory.total / (1024**3)
-            available_gb = memory.available / (1024**3)
+        if memory is not None:
+            total, available = memory
 
-            self.system_info.update({
+            total_gb = total * _GIB
+            available_gb = available * _GIB
+            percent = round((total - available) / total * 100, 1)
+
+            info = {
                 "memory_total_gb": total_gb,
                 "memory_available_gb": available_gb,
-                "memory_usage_percent": memory.percent
-            })
+                "memory_usage_percent": percent
+            }
 
-            print(f"  Memory: {total_gb:.1f} GB total, {available_gb:.1f} GB available ({memory.percent:.1f}% used)")
+            return info, f"Memory: {total_gb:.1f} GB total, {available_gb:.1f} GB available ({percent:.1f}% used)"
 
-        except ImportError:
+        else:
             # Fallback
-            self.system_info.update({
+            info = {
                 "memory_total_gb": 8.0,  # Conservative default
                 "memory_available_gb": 4.0,
                 "memory_usage_percent": 50.0
-            })
-            print("  Memory: Using default values (8 GB total)")
+            }
+            return info, "Memory: Using default values (8 GB total)"
 
     def _profile_storage(self):
         """Profile storage information."""
-        try:
-            import psutil
-            disk = psutil.disk_usage('/')
-
-            total_gb = disk.total / (1024**3)
-            free_gb = disk.free / (1024**3)
-
-            self.system_info.update({
+        disk = None
+        if hasattr(os, "statvfs"):
+            stat = os.statvfs("/")
+            disk = (stat.f_blocks * stat.f_frsize, stat.f_bavail * stat.f_frsize)
+        else:
+            psutil = _load_psutil()
+            if psutil is not None:
+                usage = psutil.disk_usage("/")
+                disk = (usage.total, usage.free)
+
+        if disk is not None:
+            total, free = disk
+
+            total_gb = total * _GIB
+            free_gb = free * _GIB
+
+            info = {
                 "storage_total_gb": total_gb,
                 "storage_free_gb": free_gb
-            })
+            }
 
-            print(f"  Storage: {total_gb:.1f} GB total, {free_gb:.1f} GB free")
+            return info, f"Storage: {total_gb:.1f} GB total, {free_gb:.1f} GB free"
 
-        except ImportError:
+        else:
             # Fallback
-            self.system_info.update({
+            info = {
                 "storage_total_gb": 100.0,
                 "storage_free_gb": 50.0
-            })
-            print("  Storage: Using default values (100 GB total)")
+            }
+            return info, "Storage: Using default values (100 GB total)"
 
     def _profile_duckdb(self):
         """Profile DuckDB version and capabilities."""
         try:
-            import duckdb
-            version = duckdb.__version__
+            # Read the installed version from package metadata instead of
+            # loading the native extension just for duckdb.__version__
+            version = metadata.version("duckdb")
 
-            self.system_info.update({
+            info = {
                 "duckdb_version": version
-            })
+            }
 
-            print(f"  DuckDB: version {version}")
+            return info, f"DuckDB: version {version}"
 
-        except ImportError:
-            self.system_info.update({
+        except metadata.PackageNotFoundError:
+            info = {
                 "duckdb_version": "unknown"
-            })
-            print("  DuckDB: Could not determine version")
+            }
+            return info, "DuckDB: Could not determine version"
 
 
 class PerformanceTuner:
     """Generate optimized DuckDB configurations based on system profiling."""
 
-    def __init__(self, system_info):
+    def __init__(self, system_info, log=print):
         self.system_info = system_info
+        self._log = log
+        self._dispatch = {workload: getattr(self, method) for workload, method in _WORKLOADS.items()}
 
     def recommend_configuration(self, workload_type="general"):
         """Recommend optimal DuckDB configuration."""
-        print(f"\n🎯 Generating configuration for {workload_type} workload...")
+        self._log(f"\n🎯 Generating configuration for {workload_type} workload...")
 
         config = {
             "version": 1,
             "duckdb": {
                 "database": "optimized_catalog.duckdb",
-                "install_extensions": ["httpfs", "parquet", "json"],
                 "pragmas": []
             }
         }
 
         # Determine configuration based on workload type
-        if workload_type == "general":
-            config = self._configure_general(config)
-        elif workload_type == "analytics":
-            config = self._configure_analytics(config)
-        elif workload_type == "concurrent":
-            config = self._configure_concurrent(config)
-        elif workload_type == "memory_constrained":
-            config = self._configure_memory_constrained(config)
+        try:
+            configure = self._dispatch[workload_type]
+        except KeyError:
+            raise ValueError(
+                f"Unknown workload type {workload_type!r}; "
+                f"expected one of: {', '.join(self._dispatch)}"
+            ) from None
 
-        return config
+        return configure(config)
 
     def _configure_general(self, config):
         """Configure for general-purpose workloads."""
-        cpu_cores = self.system_info.get("cpu_logical_cores", 4)
-        memory_gb = self.system_info.get("memory_total_gb", 8)
+        cpu_cores = self.system_info.cpu_logical_cores
+        memory_gb = self.system_info.memory_total_gb
 
         # Memory allocation (40% of available RAM)
         memory_limit_gb = max(1, int(memory_gb * 0.4))
-        config["duckdb"]["pragmas"].extend([
-            f"SET memory_limit='{memory_limit_gb}GB'",
-            f"SET threads={cpu_cores}",
-            "SET enable_optimizer=true",
-            "SET enable_optimizer_caching=true",
-            "SET force_parallelism=true",
-            "SET enable_progress_bar=true"
-        ])
+        config["duckdb"]["pragmas"] = _render_pragmas(
+            _GENERAL_PRAGMA_TEMPLATE,
+            {"memory_limit_gb": memory_limit_gb, "threads": cpu_cores},
+        )
+        config["duckdb"]["install_extensions"] = _DEFAULT_EXTENSIONS
 
         # Add memory mapping for systems with sufficient RAM
         if memory_gb >= 8:
@@ -197,131 +441,84 @@ class PerformanceTuner:
 
     def _configure_analytics(self, config):
         """Configure for analytical workloads."""
-        cpu_cores = self.system_info.get("cpu_logical_cores", 4)
-        memory_gb = self.system_info.get("memory_total_gb", 8)
+        cpu_cores = self.system_info.cpu_logical_cores
+        memory_gb = self.system_info.memory_total_gb
 
         # Aggressive memory allocation (60% of available RAM)
         memory_limit_gb = max(2, int(memory_gb * 0.6))
-        config["duckdb"]["pragmas"].extend([
-            f"SET memory_limit='{memory_limit_gb}GB'",
-            f"SET threads={max(8, cpu_cores)}",  # At least 8 threads for analytics
-            "SET enable_memory_map=true",
-            "SET enable_optimizer=true",
-            "SET enable_optimizer_caching=true",
-            "SET force_parallelism=true",
-            "SET enable_profiling=true",
-            "SET enable_join_order=true",
-            "SET enable_propagate_null_elimination=true",
-            "SET enable_distinct_projection_optimization=true"
-        ])
-
-        # Add FTS extension for text analytics
-        config["duckdb"]["install_extensions"].append("fts")
+        config["duckdb"]["pragmas"] = _render_pragmas(
+            _ANALYTICS_PRAGMA_TEMPLATE,
+            # At least 8 threads for analytics
+            {"memory_limit_gb": memory_limit_gb, "threads": max(8, cpu_cores)},
+        )
+        config["duckdb"]["install_extensions"] = _ANALYTICS_EXTENSIONS
 
         return config
 
     def _configure_concurrent(self, config):
         """Configure for high-concurrency workloads."""
-        cpu_cores = self.system_info.get("cpu_logical_cores", 4)
-        memory_gb = self.system_info.get("memory_total_gb", 8)
+        cpu_cores = self.system_info.cpu_logical_cores
+        memory_gb = self.system_info.memory_total_gb
 
         # Conservative memory allocation to handle multiple connections
         memory_limit_gb = max(1, int(memory_gb * 0.3))
-        config["duckdb"]["pragmas"].extend([
-            f"SET memory_limit='{memory_limit_gb}GB'",
-            f"SET threads={min(cpu_cores, 12)}",  # Cap at 12 threads for concurrency
-            "SET enable_optimizer=true",
-            "SET enable_optimizer_caching=true",
-            "SET force_parallelism=false",  # Let DuckDB decide for concurrent workloads
-            "SET enable_object_cache=true",
-            "SET wal_autocheckpoint=250000",
-            "SET checkpoint_threshold='500MB'"
-        ])
+        config["duckdb"]["pragmas"] = _render_pragmas(
+            _CONCURRENT_PRAGMA_TEMPLATE,
+            # Cap at 12 threads for concurrency
+            {"memory_limit_gb": memory_limit_gb, "threads": min(cpu_cores, 12)},
+        )
+        config["duckdb"]["install_extensions"] = _DEFAULT_EXTENSIONS
 
         return config
 
     def _configure_memory_constrained(self, config):
         """Configure for memory-constrained environments."""
-        memory_gb = self.system_info.get("memory_total_gb", 8)
+        memory_gb = self.system_info.memory_total_gb
 
         # Very conservative memory allocation (20% of available RAM)
         memory_limit_gb = max(0.5, int(memory_gb * 0.2))
-        config["duckdb"]["pragmas"].extend([
-            f"SET memory_limit='{memory_limit_gb}GB'",
-            "SET threads=2",  # Limited threads to reduce memory pressure
-            "SET enable_optimizer=true",
-            "SET enable_optimizer_caching=false",  # Disable caching to save memory
-            "SET force_parallelism=false",
-            "SET enable_progress_bar=true",
-            "SET checkpoint_threshold='100MB'",
-            "SET enable_profiling=false"  # Disable profiling to save resources
-        ])
-
-        # Minimal extensions to reduce memory usage
-        config["duckdb"]["install_extensions"] = ["parquet"]
+        config["duckdb"]["pragmas"] = _render_pragmas(
+            _MEMORY_CONSTRAINED_PRAGMA_TEMPLATE,
+            {"memory_limit_gb": memory_limit_gb},
+        )
+        config["duckdb"]["install_extensions"] = _MEMORY_CONSTRAINED_EXTENSIONS
 
         return config
 
     def generate_recommendations(self):
         """Generate performance recommendations based on system profile."""
-        recommendations = []
-
-        memory_gb = self.system_info.get("memory_total_gb", 8)
-        cpu_cores = self.system_info.get("cpu_logical_cores", 4)
-
-        # Memory recommendations
-        if memory_gb < 4:
-            recommendations.append({
-                "category": "Memory",
-                "priority": "High",
-                "message": "Low memory detected. Consider using memory_constrained configuration or upgrading RAM."
-            })
-        elif memory_gb >= 16:
-            recommendations.append({
-                "category": "Memory",
-                "priority": "Info",
-                "message": "High memory available. Consider analytics configuration for best performance."
-            })
-
-        # CPU recommendations
-        if cpu_cores < 4:
-            recommendations.append({
-                "category": "CPU",
-                "priority": "Medium",
-                "message": "Limited CPU cores. Performance will benefit from more cores for parallel queries."
-            })
-
-        # General recommendations
-        recommendations.extend([
-            {
-                "category": "Storage",
-                "priority": "Info",
-                "message": "Use fast SSD storage for temporary files and databases."
-            },
-            {
-                "category": "Configuration",
-                "priority": "Info",
-                "message": "Test different configurations with your actual workload for optimal results."
-            }
-        ])
+        return [rec for predicate, rec in _RECS if predicate(self.system_info)] + list(_STATIC_RECS)
 
-        return recommendations
 
+def save_configuration(serialized, filename, output_path=Path("generated_configs"), log=print):
+    """Save an already serialized YAML configuration to a file."""
+    os.makedirs(output_path, exist_ok=True)
+    filepath = output_path / filename
+    filepath.write_text(serialized, encoding="utf-8")
 
-def save_configuration(config, filename, output_dir="generated_configs"):
-    """Save configuration to a YAML file."""
-    import yaml
+    log(f"💾 Configuration saved to: {filepath}")
+    return filepath
 
-    output_path = Path(output_dir)
-    output_path.mkdir(exist_ok=True)
 
-    filepath = output_path / filename
+def load_cached_profile(path=PROFILE_CACHE_PATH, max_age=PROFILE_CACHE_MAX_AGE):
+    """Return a cached system profile younger than max_age seconds, or None."""
+    try:
+        if time.time() - path.stat().st_mtime > max_age:
+            return None
+        return SystemInfo(**json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError, TypeError):  # TypeError: cache from an older field layout
+        return None
 
-    with open(filepath, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, indent=2)
 
-    print(f"💾 Configuration saved to: {filepath}")
-    return filepath
+def store_cached_profile(system_info, path=PROFILE_CACHE_PATH, log=print):
+    """Atomically write the system profile cache."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(_dumps(asdict(system_info)), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log(f"⚠️  Could not cache system profile: {e}")
 
 
 def main():
@@ -329,7 +526,7 @@ def main():
     parser = argparse.ArgumentParser(description="DuckDB Performance Tuner")
     parser.add_argument(
         "--workload",
-        choices=["general", "analytics", "concurrent", "memory_constrained"],
+        choices=_WORKLOADS,
         default="general",
         help="Type of workload to optimize for"
     )
@@ -348,57 +545,94 @@ def main():
         action="store_true",
         help="Only profile the system, don't generate configurations"
     )
+    parser.add_argument(
+        "--cache-profile",
+        action="store_true",
+        help=f"Reuse the system profile cached in {PROFILE_CACHE_PATH} if it is less than 24h old"
+    )
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Ignore any cached system profile and re-profile (refreshes the cache with --cache-profile)"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Suppress progress output and print only the configuration (or profile with --profile-only)"
+    )
 
     args = parser.parse_args()
 
-    print("🚀 DuckDB Performance Tuner")
-    print("=" * 50)
-
-    # Profile system
-    profiler = SystemProfiler()
-    system_info = profiler.profile()
-
-    if args.profile_only:
-        print("\n📊 System Profile:")
-        print(json.dumps(system_info, indent=2))
-        return
-
-    # Generate configuration
-    tuner = PerformanceTuner(system_info)
-    config = tuner.recommend_configuration(args.workload)
-
-    # Print recommendations
-    recommendations = tuner.generate_recommendations()
-    if recommendations:
-        print("\n💡 Performance Recommendations:")
-        for rec in recommendations:
-            priority_icon = {"High": "🔴", "Medium": "🟡", "Info": "🔵"}.get(rec["priority"], "⚪")
-            print(f"  {priority_icon} {rec['category']}: {rec['message']}")
-
-    # Display generated configuration
-    print(f"\n📋 Generated Configuration ({args.workload} workload):")
-    print("-" * 30)
-
-    import yaml
-    print(yaml.dump(config, default_flow_style=False, indent=2))
-
-    # Save configuration if requested
-    if args.save:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"tuned_{args.workload}_{timestamp}.yaml"
-        save_configuration(config, filename, args.output)
-
-        # Also save system profile for reference
-        profile_filename = f"system_profile_{timestamp}.json"
-        profile_path = Path(args.output) / profile_filename
-        with open(profile_path, 'w') as f:
-            json.dump(system_info, f, indent=2)
-        print(f"💾 System profile saved to: {profile_path}")
-
-    print("\n🎯 Next steps:")
-    print("1. Save the configuration: python performance-tuner.py --save --workload analytics")
-    print("2. Generate test data: python generate-datasets.py --size medium")
-    print("3. Run benchmarks: python benchmark.py --config generated_configs/tuned_analytics.yaml")
+    # Collect output and write it in one go at the end; --quiet drops
+    # everything except the generated configuration or profile
+    output = []
+
+    def log(message=""):
+        if not args.quiet:
+            output.append(message)
+
+    try:
+        log("🚀 DuckDB Performance Tuner")
+        log("=" * 50)
+
+        # Profile system, reusing a recent cached profile when asked to
+        system_info = None
+        if args.cache_profile and not args.force_refresh:
+            system_info = load_cached_profile()
+            if system_info is not None:
+                log(f"🔍 Using cached system profile from {PROFILE_CACHE_PATH}")
+
+        if system_info is None:
+            profiler = SystemProfiler(log=log)
+            system_info = profiler.profile()
+            if args.cache_profile:
+                store_cached_profile(system_info, log=log)
+
+        if args.profile_only:
+            log("\n📊 System Profile:")
+            output.append(_dumps(asdict(system_info)))
+            return
+
+        # Generate configuration
+        tuner = PerformanceTuner(system_info, log=log)
+        config = tuner.recommend_configuration(args.workload)
+
+        # Print recommendations
+        recommendations = tuner.generate_recommendations()
+        if recommendations:
+            log("\n💡 Performance Recommendations:")
+            for rec in recommendations:
+                priority_icon = {"High": "🔴", "Medium": "🟡", "Info": "🔵"}.get(rec.priority, "⚪")
+                log(f"  {priority_icon} {rec.category}: {rec.message}")
+
+        # Display generated configuration
+        log(f"\n📋 Generated Configuration ({args.workload} workload):")
+        log("-" * 30)
+
+        # Serialize once and reuse the text for both display and saving
+        serialized = yaml.dump(config, Dumper=_ConfigDumper, default_flow_style=False, indent=2)
+        output.append(serialized)
+
+        # Save configuration if requested
+        if args.save:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = Path(args.output)
+            filename = f"tuned_{args.workload}_{timestamp}.yaml"
+            save_configuration(serialized, filename, output_path, log=log)
+
+            # Also save system profile for reference
+            profile_path = output_path / f"system_profile_{timestamp}.json"
+            profile_path.write_text(_dumps(asdict(system_info)), encoding="utf-8")
+            log(f"💾 System profile saved to: {profile_path}")
+
+        log("\n🎯 Next steps:")
+        log("1. Save the configuration: python performance-tuner.py --save --workload analytics")
+        log("2. Generate test data: python generate-datasets.py --size medium")
+        log("3. Run benchmarks: python benchmark.py --config generated_configs/tuned_analytics.yaml")
+    finally:
+        if output:
+            sys.stdout.write("\n".join(output) + "\n")
+            sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -111,8 +111,10 @@ def generate_customers(num_customers=10000, start_date="2022-01-01"):
 
     # Use exponential distribution for more recent signups
     signup_days = np.random.exponential(scale=365, size=num_customers)
-    signup_days = np.clip(signup_days, 0, (end_dt - start_dt).days)
-    signup_dates = [start_dt + timedelta(days=int(days)) for days in signup_days]
+    signup_days = np.clip(signup_days, 0, (end_dt - start_dt).days).astype(np.int64)
+    # Whole-day offsets from a datetime64[D] start stay in one int64 buffer;
+    # tolist() converts the result to datetime.date objects in C
+    signup_dates = (np.datetime64(start_dt.date(), "D") + signup_days).tolist()
 
     customers = []
     for i in range(num_customers):
@@ -137,7 +139,7 @@ def generate_customers(num_customers=10000, start_date="2022-01-01"):
         customers.append(
             {
                 "customer_id": customer_id,
-                "signup_date": signup_dates[i].date(),
+                "signup_date": signup_dates[i],
                 "acquisition_channel": np.random.choice(channels, p=channel_probs),
                 "customer_segment": segment,
                 "geographic_region": np.random.choice(regions, p=region_probs),
@@ -1,12 +1,13 @@
 """Generate event/log data using faker."""
 
-import random
 import sqlite3
 from datetime import datetime, timedelta
 from typing import Optional
 
 import duckdb
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from faker import Faker
 
 fake = Faker()
@@ -34,7 +35,7 @@ def generate_events(
 
     num_events = size_map.get(size.lower(), 1000)
 
-    event_types = [
+    event_types = np.array([
         "page_view",
         "click",
         "purchase",
@@ -44,44 +45,47 @@ def generate_events(
         "search",
         "add_to_cart",
         "remove_from_cart",
-    ]
+    ])
 
-    events = []
-    start_date = datetime.now() - timedelta(days=30)
+    rng = np.random.default_rng()
+    start_date = np.datetime64(datetime.now() - timedelta(days=30), "us")
+    offsets = rng.integers(0, 30 * 24 * 60 * 60, size=num_events, endpoint=True)
 
-    for i in range(num_events):
-        event_time = start_date + timedelta(
-            seconds=random.randint(0, 30 * 24 * 60 * 60)
-        )
+    # Only the faker-backed properties need a per-row Python loop
+    properties = pa.StructArray.from_arrays(
+        [
+            pa.array([fake.url() for _ in range(num_events)], type=pa.string()),
+            pa.array([fake.user_agent() for _ in range(num_events)], type=pa.string()),
+            pa.array([fake.ipv4() for _ in range(num_events)], type=pa.string()),
+        ],
+        names=["page", "user_agent", "ip_address"],
+    )
 
-        events.append(
-            {
-                "event_id": i + 1,
-                "user_id": random.randint(1, num_users),
-                "event_type": random.choice(event_types),
-                "event_timestamp": event_time,
-                "properties": {
-                    "page": fake.url(),
-                    "user_agent": fake.user_agent(),
-                    "ip_address": fake.ipv4(),
-                },
-            }
-        )
-
-    df = pd.DataFrame(events)
+    # Build Arrow columns straight from the numpy buffers; no DataFrame needed
+    table = pa.table(
+        {
+            "event_id": pa.array(np.arange(1, num_events + 1)),
+            "user_id": pa.array(rng.integers(1, num_users, size=num_events, endpoint=True)),
+            "event_type": pa.array(
+                event_types[rng.integers(0, len(event_types), size=num_events)], type=pa.string()
+            ),
+            "event_timestamp": pa.array(start_date + offsets.astype("timedelta64[s]")),
+            "properties": properties,
+        }
+    )
 
     if output_format.lower() == "parquet":
-        df.to_parquet(output_path, index=False)
+        pq.write_table(table, output_path, compression="zstd", compression_level=3)
     elif output_format.lower() == "csv":
-        df.to_csv(output_path, index=False)
+        table.to_pandas().to_csv(output_path, index=False)
     elif output_format.lower() == "duckdb":
         conn = duckdb.connect(output_path)
-        conn.register("events_df", df)
+        conn.register("events_df", table)
         conn.execute("CREATE TABLE events AS SELECT * FROM events_df")
         conn.close()
     elif output_format.lower() == "sqlite":
         conn = sqlite3.connect(output_path)
-        df.to_sql("events", conn, if_exists="replace", index=False)
+        table.to_pandas().to_sql("events", conn, if_exists="replace", index=False)
         conn.close()
     else:
         raise ValueError(f"Unsupported output format: {output_format}")
@@ -1,10 +1,13 @@
 """Generate user/customer data using faker."""
 
 import sqlite3
+from datetime import date
 from typing import Optional
 
 import duckdb
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
 from faker import Faker
 
 fake = Faker()
@@ -30,33 +33,36 @@ def generate_users(
 
     num_users = size_map.get(size.lower(), 100)
 
-    users = []
-    for i in range(num_users):
-        users.append(
-            {
-                "id": i + 1,
-                "name": fake.name(),
-                "email": fake.email(),
-                "signup_date": fake.date_between(start_date="-2y", end_date="today"),
-                "country": fake.country_code(),
-                "is_active": fake.boolean(chance_of_getting_true=85),
-            }
-        )
+    rng = np.random.default_rng()
+    # Signup dates within the last two years
+    signup_dates = np.datetime64(date.today(), "D") - rng.integers(
+        0, 2 * 365, size=num_users, endpoint=True
+    ).astype("timedelta64[D]")
 
-    df = pd.DataFrame(users)
+    # Build Arrow columns straight from the numpy buffers; no DataFrame needed
+    table = pa.table(
+        {
+            "id": pa.array(np.arange(1, num_users + 1)),
+            "name": pa.array([fake.name() for _ in range(num_users)], type=pa.string()),
+            "email": pa.array([fake.email() for _ in range(num_users)], type=pa.string()),
+            "signup_date": pa.array(signup_dates, type=pa.date32()),
+            "country": pa.array([fake.country_code() for _ in range(num_users)], type=pa.string()),
+            "is_active": pa.array(rng.random(num_users) < 0.85),
+        }
+    )
 
     if output_format.lower() == "parquet":
-        df.to_parquet(output_path, index=False)
+        pq.write_table(table, output_path, compression="zstd", compression_level=3)
     elif output_format.lower() == "csv":
-        df.to_csv(output_path, index=False)
+        table.to_pandas().to_csv(output_path, index=False)
     elif output_format.lower() == "duckdb":
         conn = duckdb.connect(output_path)
-        conn.register("users_df", df)
+        conn.register("users_df", table)
         conn.execute("CREATE TABLE users AS SELECT * FROM users_df")
         conn.close()
     elif output_format.lower() == "sqlite":
         conn = sqlite3.connect(output_path)
-        df.to_sql("users", conn, if_exists="replace", index=False)
+        table.to_pandas().to_sql("users", conn, if_exists="replace", index=False)
         conn.close()
     else:
         raise ValueError(f"Unsupported output format: {output_format}")
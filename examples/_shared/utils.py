@@ -1,5 +1,6 @@
 """Shared utilities for duckalog examples."""
 
+import os
 import subprocess
 import sys
 
@@ -82,3 +83,20 @@ def check_prerequisites() -> None:
 def print_separator() -> None:
     """Print a separator line."""
     print("\n" + "=" * 60 + "\n")
+
+
+def outputs_up_to_date(outputs: list[str], *sources: str) -> bool:
+    """Check whether generated files are newer than the scripts producing them.
+
+    Args:
+        outputs: Paths of the generated files
+        sources: Paths of the scripts that generate them
+
+    Returns:
+        True if every output exists and is at least as new as every source
+    """
+    newest_source = max(os.stat(source).st_mtime for source in sources)
+    try:
+        return all(os.stat(output).st_mtime >= newest_source for output in outputs)
+    except FileNotFoundError:
+        return False
@@ -1,5 +1,8 @@
 """Duckalog public API."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 # Configuration & Models
 from .config import (
     AttachmentsConfig,
@@ -19,36 +22,6 @@ from .config import (
     ViewConfig,
     load_config,
 )
-from .config_init import (
-    ConfigFormat,
-    create_config_template,
-    validate_generated_config,
-)
-
-# Core Connection & Engine
-from .connection import CatalogConnection
-from .python_api import (
-    connect_to_catalog,
-    connect_to_catalog_cm,
-    generate_sql,
-    validate_config,
-)
-
-# SQL Functionality
-from . import sql_file_loader as sql_files
-from . import sql_generation as sql
-from . import sql_utils as utils
-from .sql_file_loader import SQLFileLoader
-from .sql_generation import (
-    generate_all_views_sql,
-    generate_secret_sql,
-    generate_view_sql,
-)
-from .sql_utils import (
-    quote_ident,
-    quote_literal,
-    render_options,
-)
 
 # Errors
 from .errors import (
@@ -63,13 +36,97 @@ from .errors import (
 )
 
 
-# Convenience group for SQL functionality
-class SQLGroup:
-    """Unified access to all SQL-related functionality."""
+if TYPE_CHECKING:
+    # Give type checkers the real signatures of the lazily resolved exports
+    from . import sql_file_loader as sql_files
+    from . import sql_generation as sql
+    from . import sql_utils as utils
+    from .config_init import (
+        ConfigFormat,
+        create_config_template,
+        validate_generated_config,
+    )
+    from .connection import CatalogConnection
+    from .python_api import (
+        connect_to_catalog,
+        connect_to_catalog_cm,
+        generate_sql,
+        validate_config,
+    )
+    from .sql_file_loader import SQLFileLoader
+    from .sql_generation import (
+        generate_all_views_sql,
+        generate_secret_sql,
+        generate_view_sql,
+    )
+    from .sql_utils import (
+        quote_ident,
+        quote_literal,
+        render_options,
+    )
+
+    class SQLGroup:
+        generate = sql
+        utils = utils
+        files = sql_files
+
+
+# Everything below is imported on first attribute access (PEP 562) so that
+# ``import duckalog`` stays cheap for callers that only need the config layer.
+_LAZY = {
+    # Configuration Initialization
+    "ConfigFormat": ("duckalog.config_init", "ConfigFormat"),
+    "create_config_template": ("duckalog.config_init", "create_config_template"),
+    "validate_generated_config": ("duckalog.config_init", "validate_generated_config"),
+    # Core Connection & Engine
+    "CatalogConnection": ("duckalog.connection", "CatalogConnection"),
+    "connect_to_catalog": ("duckalog.python_api", "connect_to_catalog"),
+    "connect_to_catalog_cm": ("duckalog.python_api", "connect_to_catalog_cm"),
+    "generate_sql": ("duckalog.python_api", "generate_sql"),
+    "validate_config": ("duckalog.python_api", "validate_config"),
+    # SQL Functionality (``None`` resolves to the module itself)
+    "sql_files": ("duckalog.sql_file_loader", None),
+    "sql": ("duckalog.sql_generation", None),
+    "utils": ("duckalog.sql_utils", None),
+    "SQLFileLoader": ("duckalog.sql_file_loader", "SQLFileLoader"),
+    "generate_all_views_sql": ("duckalog.sql_generation", "generate_all_views_sql"),
+    "generate_secret_sql": ("duckalog.sql_generation", "generate_secret_sql"),
+    "generate_view_sql": ("duckalog.sql_generation", "generate_view_sql"),
+    "quote_ident": ("duckalog.sql_utils", "quote_ident"),
+    "quote_literal": ("duckalog.sql_utils", "quote_literal"),
+    "render_options": ("duckalog.sql_utils", "render_options"),
+}
+
+
+def _make_sql_group():
+    """Build the SQL convenience group, importing its modules on demand."""
+
+    class SQLGroup:
+        """Unified access to all SQL-related functionality."""
+
+        generate = __getattr__("sql")
+        utils = __getattr__("utils")
+        files = __getattr__("sql_files")
+
+    SQLGroup.__qualname__ = "SQLGroup"
+    return SQLGroup
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        module = importlib.import_module(module_name)
+        value = module if attr is None else getattr(module, attr)
+    elif name == "SQLGroup":
+        value = _make_sql_group()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
-    generate = sql
-    utils = utils
-    files = sql_files
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
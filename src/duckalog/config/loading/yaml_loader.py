@@ -0,0 +1,32 @@
+"""YAML parsing helpers shared by the local and remote config loaders."""
+
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+
+# PyYAML exposes the libyaml-backed loader only when it was built against
+# libyaml; fall back to the pure-Python loader otherwise. Both implement the
+# same safe subset of YAML, so parsed results are identical.
+SafeYamlLoader: type = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load_yaml(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse YAML using the fastest available safe loader.
+
+    Drop-in replacement for ``yaml.safe_load`` that prefers ``CSafeLoader``.
+
+    Args:
+        stream: YAML text, bytes, or an open file object.
+
+    Returns:
+        The parsed Python object.
+
+    Raises:
+        yaml.YAMLError: If the content is not valid YAML.
+    """
+    return yaml.load(stream, Loader=SafeYamlLoader)
+
+
+__all__ = ["SafeYamlLoader", "safe_load_yaml"]
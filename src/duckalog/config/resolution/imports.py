@@ -12,8 +12,6 @@ from typing import Any, Optional, Union, TYPE_CHECKING
 if TYPE_CHECKING:
     pass
 
-import yaml
-
 from duckalog.errors import (
     CircularImportError,
     ConfigError,
@@ -32,6 +30,7 @@ from ..validators import (
     _resolve_paths_in_config,
 )
 from ..loading.sql import load_sql_files_from_config, process_sql_file_references
+from ..loading.yaml_loader import safe_load_yaml
 from ..security.path import path_resolution_context
 from .env import EnvCache, _load_dotenv_files_for_config
 from ...performance import PerformanceMetrics
@@ -456,7 +455,7 @@ def _resolve_and_load_import(
                 else nullcontext()
             ):
                 if suffix in {".yaml", ".yml"}:
-                    parsed = yaml.safe_load(raw_text)
+                    parsed = safe_load_yaml(raw_text)
                 elif suffix == ".json":
                     parsed = json.loads(raw_text)
                 else:
@@ -594,7 +593,7 @@ def _load_config_with_imports(
         try:
             if Path(file_path).exists():
                 with open(file_path, "r") as f:
-                    raw_config = yaml.safe_load(f)
+                    raw_config = safe_load_yaml(f)
                     if (
                         raw_config
                         and isinstance(raw_config, dict)
@@ -632,7 +631,7 @@ def _load_config_with_imports(
 
         with metrics.timer("parsing", path=resolved_path) if metrics else nullcontext():
             if format == "yaml":
-                parsed = yaml.safe_load(raw_text)
+                parsed = safe_load_yaml(raw_text)
             elif format == "json":
                 parsed = json.loads(raw_text)
             else:
@@ -383,8 +383,10 @@ def load_config_from_uri(
     if suffix in {".yaml", ".yml"}:
         import yaml
 
+        from .config.loading.yaml_loader import safe_load_yaml
+
         try:
-            parsed_config = yaml.safe_load(content)
+            parsed_config = safe_load_yaml(content)
         except yaml.YAMLError as exc:
             raise RemoteConfigError(f"Invalid YAML in remote config: {exc}") from exc
     elif suffix == ".json":
@@ -2618,3 +2618,17 @@ def test_dotenv_invalid_custom_patterns_fallback(tmp_path):
 
     # Should fall back to .env file
     assert config.duckdb.database == "fallback_value.duckdb"
+
+
+def test_safe_load_yaml_prefers_libyaml_loader():
+    """YAML configs are parsed with the C loader when PyYAML provides it."""
+    import yaml
+
+    from duckalog.config.loading.yaml_loader import SafeYamlLoader, safe_load_yaml
+
+    expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert SafeYamlLoader is expected
+    assert safe_load_yaml("version: 1\nviews: []\n") == {"version": 1, "views": []}
+
+    with pytest.raises(yaml.constructor.ConstructorError):
+        safe_load_yaml("!!python/object:os.system {}")
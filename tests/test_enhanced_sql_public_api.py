@@ -7,6 +7,8 @@ while maintaining backward compatibility.
 
 from __future__ import annotations
 
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
@@ -422,3 +424,23 @@ def test_real_world_usage_patterns():
 
     except Exception as e:
         pytest.fail(f"Real-world usage patterns test failed: {e}")
+
+
+def test_package_import_does_not_load_duckdb():
+    """Test that importing duckalog defers the engine stack until it is used."""
+    script = (
+        "import sys, duckalog; "
+        "print('duckdb' in sys.modules); "
+        "duckalog.generate_view_sql; "
+        "print('duckalog.sql_generation' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        check=False,
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).parent.parent,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["False", "True"]